@@ -12,11 +12,16 @@ import json
 from datetime import datetime, timedelta
 import time
 import logging
+import re
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keywords that mark a dispatch row as price-related. Matched against
+# upper-case text: case-sensitive matching is much cheaper than IGNORECASE
+PRICE_KEYWORD_PATTERN = re.compile(r'PRICE|DISPATCH|REGION|NSW|VIC|QLD|SA|TAS')
+
 class AEMONEMWebScraper:
     """Scraper for AEMO NEMWeb dispatch data"""
     
@@ -69,18 +74,22 @@ class AEMONEMWebScraper:
         if not content:
             return []
         
-        price_data = []
-        csv_reader = csv.reader(io.StringIO(content))
-        rows = list(csv_reader)
+        # Look for price-related data with one regex scan per raw line and
+        # only CSV-parse the lines that match. The file is upper-cased once as
+        # a whole rather than line by line
+        lines = content.splitlines()
+        upper_content = content.upper()
+        if upper_content == content:
+            # Dispatch files are upper case throughout, so their lines can be
+            # matched as they are
+            matching_lines = [line for line in lines if PRICE_KEYWORD_PATTERN.search(line)]
+        else:
+            matching_lines = [
+                line for line, upper_line in zip(lines, upper_content.splitlines())
+                if PRICE_KEYWORD_PATTERN.search(upper_line)
+            ]
         
-        for row in rows:
-            if row and len(row) > 0:
-                # Look for price-related data
-                row_str = ' '.join(row).upper()
-                if any(keyword in row_str for keyword in [
-                    'PRICE', 'DISPATCH', 'REGION', 'NSW', 'VIC', 'QLD', 'SA', 'TAS'
-                ]):
-                    price_data.append(row)
+        price_data = [row for row in csv.reader(matching_lines) if row]
         
         return price_data
     
@@ -0,0 +1,15 @@
+import math
+from sqlalchemy import func
+
+def sample_std(db, column, filters, count, mean):
+    """Sample standard deviation of column over the filtered rows (None below two values)
+
+    The squared deviations from the already known mean are summed in the
+    database, which keeps precision when the values are close together,
+    unlike subtracting the squared mean from the sum of squares.
+    """
+    if not count or count < 2:
+        return None
+    deviation = column - mean
+    squares = db.query(func.sum(deviation * deviation)).filter(*filters).scalar()
+    return math.sqrt((squares or 0.0) / (count - 1))
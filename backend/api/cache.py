@@ -0,0 +1,48 @@
+import time
+from functools import wraps
+from sqlalchemy.orm import Session
+
+# Stats and lookup lists only change when new data is collected
+RESPONSE_CACHE_TTL = 60
+RESPONSE_CACHE_SIZE = 64
+
+_response_caches = []
+
+def cached_response(ttl=RESPONSE_CACHE_TTL, maxsize=RESPONSE_CACHE_SIZE):
+    """Cache an async endpoint's result per query parameters for a short TTL
+
+    The database session is left out of the key, so any request with the same
+    filters shares the cached result.
+    """
+    def decorator(func):
+        entries = {}
+        _response_caches.append(entries)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = tuple(sorted(
+                (name, value) for name, value in kwargs.items()
+                if not isinstance(value, Session)
+            ))
+            now = time.monotonic()
+
+            entry = entries.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+            result = await func(*args, **kwargs)
+
+            entries.pop(key, None)
+            if len(entries) >= maxsize:
+                # Evict the oldest entry
+                entries.pop(next(iter(entries)))
+            entries[key] = (now + ttl, result)
+            return result
+
+        return wrapper
+    return decorator
+
+def clear_response_caches():
+    """Drop all cached responses, e.g. after new data has been stored"""
+    for entries in _response_caches:
+        entries.clear()
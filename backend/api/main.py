@@ -1,11 +1,14 @@
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import uvicorn
 import os
 
-from backend.database.database import get_db, create_tables
+from backend.api.cache import cached_response
+from backend.database.database import get_db, create_tables, SessionLocal, ElectricityPrice, DamLevel
 from backend.api.routes import electricity, dams, scraper
 from backend.data.collectors.aemo_collector import AEMOCollector, get_sample_electricity_data
 from backend.data.collectors.dam_collector import DamCollector, get_sample_dam_data
@@ -14,7 +17,8 @@ from backend.data.collectors.dam_collector import DamCollector, get_sample_dam_d
 app = FastAPI(
     title="Australian Electricity Market Dashboard API",
     description="API for monitoring Australian wholesale electricity prices and dam levels",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Railway-compatible CORS configuration
@@ -48,22 +52,16 @@ async def startup_event():
     create_tables()
     
     # Populate with sample data if database is empty
-    db = next(get_db())
-    try:
-        from backend.database.database import ElectricityPrice, DamLevel
-        
+    with SessionLocal() as db:
         # Check if we have any data
         if db.query(ElectricityPrice).count() == 0:
             print("Populating database with sample electricity data...")
             sample_data = get_sample_electricity_data()
             
-            # Insert sample data in batches
-            batch_size = 1000
+            # Insert sample data in batches (one executemany INSERT per batch)
+            batch_size = 10_000
             for i in range(0, len(sample_data), batch_size):
-                batch = sample_data[i:i + batch_size]
-                for data in batch:
-                    price_record = ElectricityPrice(**data)
-                    db.add(price_record)
+                db.execute(insert(ElectricityPrice), sample_data[i:i + batch_size])
                 db.commit()
                 print(f"Inserted batch {i//batch_size + 1}")
         
@@ -71,18 +69,12 @@ async def startup_event():
             print("Populating database with sample dam data...")
             sample_data = get_sample_dam_data()
             
-            # Insert sample data in batches
-            batch_size = 1000
+            # Insert sample data in batches (one executemany INSERT per batch)
+            batch_size = 10_000
             for i in range(0, len(sample_data), batch_size):
-                batch = sample_data[i:i + batch_size]
-                for data in batch:
-                    dam_record = DamLevel(**data)
-                    db.add(dam_record)
+                db.execute(insert(DamLevel), sample_data[i:i + batch_size])
                 db.commit()
                 print(f"Inserted batch {i//batch_size + 1}")
-                
-    finally:
-        db.close()
 
 @app.get("/")
 async def root():
@@ -93,31 +85,29 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now()}
 
 @app.get("/api/stats")
+@cached_response()
 async def get_stats(db: Session = Depends(get_db)):
     """Get basic statistics about the data"""
-    from backend.database.database import ElectricityPrice, DamLevel
-    
     try:
-        electricity_count = db.query(ElectricityPrice).count()
-        dam_count = db.query(DamLevel).count()
-        
-        # Get date range
-        latest_electricity = db.query(ElectricityPrice.timestamp).order_by(ElectricityPrice.timestamp.desc()).first()
-        earliest_electricity = db.query(ElectricityPrice.timestamp).order_by(ElectricityPrice.timestamp.asc()).first()
+        # Count and date range for each table in a single aggregate query
+        electricity_count, earliest_electricity, latest_electricity = db.query(
+            func.count(), func.min(ElectricityPrice.timestamp), func.max(ElectricityPrice.timestamp)
+        ).select_from(ElectricityPrice).one()
         
-        latest_dam = db.query(DamLevel.timestamp).order_by(DamLevel.timestamp.desc()).first()
-        earliest_dam = db.query(DamLevel.timestamp).order_by(DamLevel.timestamp.asc()).first()
+        dam_count, earliest_dam, latest_dam = db.query(
+            func.count(), func.min(DamLevel.timestamp), func.max(DamLevel.timestamp)
+        ).select_from(DamLevel).one()
         
         return {
             "electricity_records": electricity_count,
             "dam_records": dam_count,
             "electricity_date_range": {
-                "earliest": earliest_electricity[0] if earliest_electricity else None,
-                "latest": latest_electricity[0] if latest_electricity else None
+                "earliest": earliest_electricity,
+                "latest": latest_electricity
             },
             "dam_date_range": {
-                "earliest": earliest_dam[0] if earliest_dam else None,
-                "latest": latest_dam[0] if latest_dam else None
+                "earliest": earliest_dam,
+                "latest": latest_dam
             }
         }
     except Exception as e:
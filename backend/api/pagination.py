@@ -0,0 +1,23 @@
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+from datetime import datetime
+
+def encode_cursor(row):
+    """Build an opaque keyset cursor from the last row of a page"""
+    return f"{row.timestamp.isoformat()}|{row.id}"
+
+def decode_cursor(cursor):
+    """Parse a keyset cursor into (timestamp, id)"""
+    try:
+        timestamp, row_id = cursor.rsplit('|', 1)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def seek_after(model, cursor):
+    """Filter for rows after the cursor in (timestamp desc, id desc) order"""
+    timestamp, row_id = cursor
+    return or_(
+        model.timestamp < timestamp,
+        and_(model.timestamp == timestamp, model.id < row_id)
+    )
@@ -1,9 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import distinct_on
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import List, Optional
-import pandas as pd
 
+from backend.api.aggregates import sample_std
+from backend.api.cache import cached_response, clear_response_caches
+from backend.api.pagination import encode_cursor, decode_cursor, seek_after
 from backend.database.database import get_db, DamLevel
 from backend.data.models.dams import (
     DamLevelResponse, 
@@ -13,6 +19,9 @@ from backend.data.models.dams import (
 
 router = APIRouter()
 
+# Validates a whole list of ORM rows in one call
+DAM_LIST_ADAPTER = TypeAdapter(List[DamLevelResponse])
+
 @router.get("/levels", response_model=DamLevelList)
 async def get_dam_levels(
     start_date: Optional[datetime] = Query(None, description="Start date for data"),
@@ -22,9 +31,12 @@ async def get_dam_levels(
     include_zero: bool = Query(False, description="Include records with zero capacity"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(100, ge=1, le=1000, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces page)"),
     db: Session = Depends(get_db)
 ):
     """Get dam levels with optional filtering"""
+    seek = decode_cursor(cursor) if cursor else None
+    
     try:
         query = db.query(DamLevel)
         
@@ -42,18 +54,38 @@ async def get_dam_levels(
         if not include_zero:
             query = query.filter(DamLevel.capacity_percentage > 0)
         
-        # Get total count
-        total = query.count()
+        query = query.order_by(DamLevel.timestamp.desc(), DamLevel.id.desc())
         
-        # Apply pagination
-        offset = (page - 1) * size
-        dam_levels = query.order_by(DamLevel.timestamp.desc()).offset(offset).limit(size).all()
+        if seek:
+            # Seek past the cursor instead of scanning and discarding earlier
+            # pages; one extra row shows whether another page follows
+            rows = query.filter(seek_after(DamLevel, seek)).limit(size + 1).all()
+            dam_levels = rows[:size]
+            total = None
+            has_more = len(rows) > size
+        else:
+            # Apply pagination, fetching the total count with the page itself
+            offset = (page - 1) * size
+            rows = query.add_columns(
+                func.count().over().label('_total')
+            ).offset(offset).limit(size).all()
+            dam_levels = [row[0] for row in rows]
+            
+            # A page past the end has no rows to carry the total
+            if rows:
+                total = rows[0]._total
+            else:
+                total = query.count() if offset else 0
+            
+            has_more = total > offset + len(rows)
         
         return DamLevelList(
-            dam_levels=[DamLevelResponse.model_validate(level) for level in dam_levels],
+            dam_levels=DAM_LIST_ADAPTER.validate_python(dam_levels, from_attributes=True),
             total=total,
             page=page,
-            size=size
+            size=size,
+            has_more=has_more,
+            next_cursor=encode_cursor(dam_levels[-1]) if has_more else None
         )
         
     except Exception as e:
@@ -64,32 +96,46 @@ async def get_current_dam_levels(db: Session = Depends(get_db)):
     """Get the most recent dam levels for all dams (excluding zero values)"""
     try:
         # Get the most recent record for each dam with non-zero capacity
-        from sqlalchemy import func
-        
-        # Subquery to get the latest timestamp for each dam with non-zero capacity
-        latest_timestamps = db.query(
-            DamLevel.dam_name,
-            DamLevel.state,
-            func.max(DamLevel.timestamp).label('latest_timestamp')
-        ).filter(
-            DamLevel.capacity_percentage > 0
-        ).group_by(
-            DamLevel.dam_name,
-            DamLevel.state
-        ).subquery()
-        
-        # Get the actual records for each dam at their latest timestamp
-        levels = db.query(DamLevel).join(
-            latest_timestamps,
-            (DamLevel.dam_name == latest_timestamps.c.dam_name) &
-            (DamLevel.state == latest_timestamps.c.state) &
-            (DamLevel.timestamp == latest_timestamps.c.latest_timestamp)
-        ).filter(
-            DamLevel.capacity_percentage > 0
-        ).order_by(
-            DamLevel.state,
-            DamLevel.dam_name
-        ).all()
+        if db.bind.dialect.name == 'postgresql':
+            # DISTINCT ON picks the latest row per dam in a single scan
+            levels = db.query(DamLevel).filter(
+                DamLevel.capacity_percentage > 0
+            ).order_by(
+                DamLevel.dam_name,
+                DamLevel.state,
+                DamLevel.timestamp.desc()
+            ).ext(
+                distinct_on(
+                    DamLevel.dam_name,
+                    DamLevel.state
+                )
+            ).all()
+            levels.sort(key=lambda level: (level.state, level.dam_name))
+        else:
+            # Subquery to get the latest timestamp for each dam with non-zero capacity
+            latest_timestamps = db.query(
+                DamLevel.dam_name,
+                DamLevel.state,
+                func.max(DamLevel.timestamp).label('latest_timestamp')
+            ).filter(
+                DamLevel.capacity_percentage > 0
+            ).group_by(
+                DamLevel.dam_name,
+                DamLevel.state
+            ).subquery()
+            
+            # Get the actual records for each dam at their latest timestamp
+            levels = db.query(DamLevel).join(
+                latest_timestamps,
+                (DamLevel.dam_name == latest_timestamps.c.dam_name) &
+                (DamLevel.state == latest_timestamps.c.state) &
+                (DamLevel.timestamp == latest_timestamps.c.latest_timestamp)
+            ).filter(
+                DamLevel.capacity_percentage > 0
+            ).order_by(
+                DamLevel.state,
+                DamLevel.dam_name
+            ).all()
         
         if not levels:
             return {"message": "No dam level data available"}
@@ -99,7 +145,7 @@ async def get_current_dam_levels(db: Session = Depends(get_db)):
         
         return {
             "timestamp": latest_timestamp,
-            "dam_levels": [DamLevelResponse.model_validate(level) for level in levels]
+            "dam_levels": DAM_LIST_ADAPTER.validate_python(levels, from_attributes=True)
         }
         
     except Exception as e:
@@ -117,44 +163,55 @@ async def get_dam_level_trends(
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        query = db.query(DamLevel).filter(
+        filters = [
             DamLevel.timestamp >= start_date,
             DamLevel.timestamp <= end_date
-        )
+        ]
         
         if state:
-            query = query.filter(DamLevel.state == state)
+            filters.append(DamLevel.state == state)
         if dam_name:
-            query = query.filter(DamLevel.dam_name == dam_name)
+            filters.append(DamLevel.dam_name == dam_name)
         
-        levels = query.order_by(DamLevel.timestamp.asc()).all()
+        # Aggregate per day and dam in the database with a single scan;
+        # the overall average and range are combined from these partial aggregates
+        day = func.date(DamLevel.timestamp).label('date')
+        groups = db.query(
+            day,
+            DamLevel.dam_name,
+            func.count(DamLevel.capacity_percentage).label('count'),
+            func.sum(DamLevel.capacity_percentage).label('total'),
+            func.min(DamLevel.capacity_percentage).label('minimum'),
+            func.max(DamLevel.capacity_percentage).label('maximum')
+        ).filter(*filters).group_by(
+            day,
+            DamLevel.dam_name
+        ).order_by(
+            day,
+            DamLevel.dam_name
+        ).all()
         
-        if not levels:
+        if not groups:
             return {"message": "No data available for the specified period"}
         
-        # Convert to DataFrame for analysis
-        df = pd.DataFrame([{
-            'timestamp': level.timestamp,
-            'dam_name': level.dam_name,
-            'state': level.state,
-            'capacity_percentage': level.capacity_percentage,
-            'volume_ml': level.volume_ml
-        } for level in levels])
-        
-        # Calculate daily averages
-        df['date'] = df['timestamp'].dt.date
-        daily_avg = df.groupby(['date', 'dam_name'])['capacity_percentage'].mean().reset_index()
+        count = sum(group.count for group in groups)
+        total = sum(group.total or 0.0 for group in groups)
+        mean = total / count if count else None
         
         # Calculate statistics
         stats = {
             'period': f"{days} days",
             'start_date': start_date.isoformat(),
             'end_date': end_date.isoformat(),
-            'average_capacity': df['capacity_percentage'].mean(),
-            'min_capacity': df['capacity_percentage'].min(),
-            'max_capacity': df['capacity_percentage'].max(),
-            'capacity_volatility': df['capacity_percentage'].std(),
-            'daily_averages': daily_avg.to_dict('records')
+            'average_capacity': mean,
+            'min_capacity': min((group.minimum for group in groups if group.count), default=None),
+            'max_capacity': max((group.maximum for group in groups if group.count), default=None),
+            'capacity_volatility': sample_std(db, DamLevel.capacity_percentage, filters, count, mean),
+            'daily_averages': [{
+                'date': group.date,
+                'dam_name': group.dam_name,
+                'capacity_percentage': group.total / group.count if group.count else None
+            } for group in groups]
         }
         
         return stats
@@ -163,6 +220,7 @@ async def get_dam_level_trends(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/levels/states")
+@cached_response()
 async def get_states(db: Session = Depends(get_db)):
     """Get list of available states"""
     try:
@@ -172,6 +230,7 @@ async def get_states(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/levels/dams")
+@cached_response()
 async def get_dams(
     state: Optional[str] = Query(None, description="Filter by state"),
     db: Session = Depends(get_db)
@@ -197,8 +256,11 @@ async def create_dam_level(
         level = DamLevel(**level_data.model_dump())
         db.add(level)
         db.commit()
-        db.refresh(level)
+        clear_response_caches()
         return DamLevelResponse.model_validate(level)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A level for this dam and timestamp already exists")
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
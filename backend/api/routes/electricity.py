@@ -1,9 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import distinct_on
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import List, Optional
-import pandas as pd
 
+from backend.api.aggregates import sample_std
+from backend.api.cache import cached_response, clear_response_caches
+from backend.api.pagination import encode_cursor, decode_cursor, seek_after
 from backend.database.database import get_db, ElectricityPrice
 from backend.data.models.electricity import (
     ElectricityPriceResponse, 
@@ -13,6 +19,9 @@ from backend.data.models.electricity import (
 
 router = APIRouter()
 
+# Validates a whole list of ORM rows in one call
+PRICE_LIST_ADAPTER = TypeAdapter(List[ElectricityPriceResponse])
+
 @router.get("/prices", response_model=ElectricityPriceList)
 async def get_electricity_prices(
     start_date: Optional[datetime] = Query(None, description="Start date for data"),
@@ -21,9 +30,12 @@ async def get_electricity_prices(
     include_zero: bool = Query(False, description="Include records with zero prices"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(100, ge=1, le=1000, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces page)"),
     db: Session = Depends(get_db)
 ):
     """Get electricity prices with optional filtering"""
+    seek = decode_cursor(cursor) if cursor else None
+    
     try:
         query = db.query(ElectricityPrice)
         
@@ -39,18 +51,38 @@ async def get_electricity_prices(
         if not include_zero:
             query = query.filter(ElectricityPrice.price > 0)
         
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination
-        offset = (page - 1) * size
-        prices = query.order_by(ElectricityPrice.timestamp.desc()).offset(offset).limit(size).all()
+        query = query.order_by(ElectricityPrice.timestamp.desc(), ElectricityPrice.id.desc())
+        
+        if seek:
+            # Seek past the cursor instead of scanning and discarding earlier
+            # pages; one extra row shows whether another page follows
+            rows = query.filter(seek_after(ElectricityPrice, seek)).limit(size + 1).all()
+            prices = rows[:size]
+            total = None
+            has_more = len(rows) > size
+        else:
+            # Apply pagination, fetching the total count with the page itself
+            offset = (page - 1) * size
+            rows = query.add_columns(
+                func.count().over().label('_total')
+            ).offset(offset).limit(size).all()
+            prices = [row[0] for row in rows]
+            
+            # A page past the end has no rows to carry the total
+            if rows:
+                total = rows[0]._total
+            else:
+                total = query.count() if offset else 0
+            
+            has_more = total > offset + len(rows)
         
         return ElectricityPriceList(
-            prices=[ElectricityPriceResponse.model_validate(price) for price in prices],
+            prices=PRICE_LIST_ADAPTER.validate_python(prices, from_attributes=True),
             total=total,
             page=page,
-            size=size
+            size=size,
+            has_more=has_more,
+            next_cursor=encode_cursor(prices[-1]) if has_more else None
         )
         
     except Exception as e:
@@ -61,28 +93,39 @@ async def get_current_prices(db: Session = Depends(get_db)):
     """Get the most recent electricity prices for all regions (excluding zero values)"""
     try:
         # Get the most recent record for each region with non-zero prices
-        from sqlalchemy import func
-        
-        # Subquery to get the latest timestamp for each region with non-zero prices
-        latest_timestamps = db.query(
-            ElectricityPrice.region,
-            func.max(ElectricityPrice.timestamp).label('latest_timestamp')
-        ).filter(
-            ElectricityPrice.price > 0
-        ).group_by(
-            ElectricityPrice.region
-        ).subquery()
-        
-        # Get the actual records for each region at their latest timestamp
-        prices = db.query(ElectricityPrice).join(
-            latest_timestamps,
-            (ElectricityPrice.region == latest_timestamps.c.region) &
-            (ElectricityPrice.timestamp == latest_timestamps.c.latest_timestamp)
-        ).filter(
-            ElectricityPrice.price > 0
-        ).order_by(
-            ElectricityPrice.region
-        ).all()
+        if db.bind.dialect.name == 'postgresql':
+            # DISTINCT ON picks the latest row per region in a single scan
+            prices = db.query(ElectricityPrice).filter(
+                ElectricityPrice.price > 0
+            ).order_by(
+                ElectricityPrice.region,
+                ElectricityPrice.timestamp.desc()
+            ).ext(
+                distinct_on(
+                    ElectricityPrice.region
+                )
+            ).all()
+        else:
+            # Subquery to get the latest timestamp for each region with non-zero prices
+            latest_timestamps = db.query(
+                ElectricityPrice.region,
+                func.max(ElectricityPrice.timestamp).label('latest_timestamp')
+            ).filter(
+                ElectricityPrice.price > 0
+            ).group_by(
+                ElectricityPrice.region
+            ).subquery()
+            
+            # Get the actual records for each region at their latest timestamp
+            prices = db.query(ElectricityPrice).join(
+                latest_timestamps,
+                (ElectricityPrice.region == latest_timestamps.c.region) &
+                (ElectricityPrice.timestamp == latest_timestamps.c.latest_timestamp)
+            ).filter(
+                ElectricityPrice.price > 0
+            ).order_by(
+                ElectricityPrice.region
+            ).all()
         
         if not prices:
             return {"message": "No electricity price data available"}
@@ -92,7 +135,7 @@ async def get_current_prices(db: Session = Depends(get_db)):
         
         return {
             "timestamp": latest_timestamp,
-            "prices": [ElectricityPriceResponse.model_validate(price) for price in prices]
+            "prices": PRICE_LIST_ADAPTER.validate_python(prices, from_attributes=True)
         }
         
     except Exception as e:
@@ -109,42 +152,53 @@ async def get_price_trends(
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        query = db.query(ElectricityPrice).filter(
+        filters = [
             ElectricityPrice.timestamp >= start_date,
             ElectricityPrice.timestamp <= end_date
-        )
+        ]
         
         if region:
-            query = query.filter(ElectricityPrice.region == region)
+            filters.append(ElectricityPrice.region == region)
         
-        prices = query.order_by(ElectricityPrice.timestamp.asc()).all()
+        # Aggregate per day and region in the database with a single scan;
+        # the overall average and range are combined from these partial aggregates
+        day = func.date(ElectricityPrice.timestamp).label('date')
+        groups = db.query(
+            day,
+            ElectricityPrice.region,
+            func.count(ElectricityPrice.price).label('count'),
+            func.sum(ElectricityPrice.price).label('total'),
+            func.min(ElectricityPrice.price).label('minimum'),
+            func.max(ElectricityPrice.price).label('maximum')
+        ).filter(*filters).group_by(
+            day,
+            ElectricityPrice.region
+        ).order_by(
+            day,
+            ElectricityPrice.region
+        ).all()
         
-        if not prices:
+        if not groups:
             return {"message": "No data available for the specified period"}
         
-        # Convert to DataFrame for analysis
-        df = pd.DataFrame([{
-            'timestamp': price.timestamp,
-            'region': price.region,
-            'price': price.price,
-            'demand': price.demand,
-            'supply': price.supply
-        } for price in prices])
-        
-        # Calculate daily averages
-        df['date'] = df['timestamp'].dt.date
-        daily_avg = df.groupby(['date', 'region'])['price'].mean().reset_index()
+        count = sum(group.count for group in groups)
+        total = sum(group.total or 0.0 for group in groups)
+        mean = total / count if count else None
         
         # Calculate statistics
         stats = {
             'period': f"{days} days",
             'start_date': start_date.isoformat(),
             'end_date': end_date.isoformat(),
-            'average_price': df['price'].mean(),
-            'min_price': df['price'].min(),
-            'max_price': df['price'].max(),
-            'price_volatility': df['price'].std(),
-            'daily_averages': daily_avg.to_dict('records')
+            'average_price': mean,
+            'min_price': min((group.minimum for group in groups if group.count), default=None),
+            'max_price': max((group.maximum for group in groups if group.count), default=None),
+            'price_volatility': sample_std(db, ElectricityPrice.price, filters, count, mean),
+            'daily_averages': [{
+                'date': group.date,
+                'region': group.region,
+                'price': group.total / group.count if group.count else None
+            } for group in groups]
         }
         
         return stats
@@ -153,6 +207,7 @@ async def get_price_trends(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/prices/regions")
+@cached_response()
 async def get_regions(db: Session = Depends(get_db)):
     """Get list of available regions"""
     try:
@@ -171,8 +226,11 @@ async def create_electricity_price(
         price = ElectricityPrice(**price_data.model_dump())
         db.add(price)
         db.commit()
-        db.refresh(price)
+        clear_response_caches()
         return ElectricityPriceResponse.model_validate(price)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="A price for this region and timestamp already exists")
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
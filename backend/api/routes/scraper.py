@@ -1,67 +1,70 @@
 from fastapi import APIRouter, BackgroundTasks, HTTPException
+from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 import asyncio
-import subprocess
-import sys
-import os
+
+from backend.api.cache import clear_response_caches
+from backend.data.collectors.real_only_collection import run as collect_real_only_data
 
 router = APIRouter()
 
-# Global variable to track scraper status
-scraper_status = {
-    "is_running": False,
-    "last_run": None,
-    "last_error": None,
-    "progress": "Ready to collect data"
-}
+STARTED_AT = datetime.now().isoformat()
 
-def run_data_collection():
-    """Run the data collection script in the background"""
-    global scraper_status
-    
+class ScraperState(BaseModel):
+    """Snapshot of the scraper status; replaced as a whole on every change"""
+    is_running: bool = False
+    last_run: Optional[str] = None
+    last_error: Optional[str] = None
+    progress: str = "Ready to collect data"
+    timestamp: str = STARTED_AT  # When the state last changed
+
+scraper_state = ScraperState()
+
+# Serializes state transitions, including the check-and-set in /start
+scraper_lock = asyncio.Lock()
+
+def _transition(**changes):
+    """Replace the state snapshot; call with scraper_lock held"""
+    global scraper_state
+    scraper_state = scraper_state.model_copy(
+        update={**changes, "timestamp": datetime.now().isoformat()}
+    )
+
+async def update_scraper_state(**changes):
+    """Apply a state change under the lock"""
+    async with scraper_lock:
+        _transition(**changes)
+
+async def run_data_collection():
+    """Run the real-only data collection in the background"""
     try:
-        scraper_status["is_running"] = True
-        scraper_status["progress"] = "Starting data collection..."
-        scraper_status["last_error"] = None
+        await update_scraper_state(progress="Starting data collection...", last_error=None)
         
-        # Change to the project directory
-        project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+        # Run the collector in-process instead of spawning a new interpreter
+        await collect_real_only_data()
+        clear_response_caches()
         
-        # Run the real-only data collection script
-        result = subprocess.run(
-            [sys.executable, "collect_real_only_data.py"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+        await update_scraper_state(
+            progress="Data collection completed successfully!",
+            last_run=datetime.now().isoformat()
         )
-        
-        if result.returncode == 0:
-            scraper_status["progress"] = "Data collection completed successfully!"
-            scraper_status["last_run"] = datetime.now().isoformat()
-        else:
-            scraper_status["progress"] = f"Data collection failed: {result.stderr}"
-            scraper_status["last_error"] = result.stderr
             
-    except subprocess.TimeoutExpired:
-        scraper_status["progress"] = "Data collection timed out after 5 minutes"
-        scraper_status["last_error"] = "Timeout"
     except Exception as e:
-        scraper_status["progress"] = f"Data collection error: {str(e)}"
-        scraper_status["last_error"] = str(e)
+        await update_scraper_state(progress=f"Data collection error: {str(e)}", last_error=str(e))
     finally:
-        scraper_status["is_running"] = False
+        await update_scraper_state(is_running=False)
 
 @router.post("/start")
 async def start_data_collection(background_tasks: BackgroundTasks):
     """Start the data collection process"""
-    global scraper_status
-    
-    if scraper_status["is_running"]:
-        raise HTTPException(
-            status_code=400, 
-            detail="Data collection is already running. Please wait for it to complete."
-        )
+    async with scraper_lock:
+        if scraper_state.is_running:
+            raise HTTPException(
+                status_code=400, 
+                detail="Data collection is already running. Please wait for it to complete."
+            )
+        _transition(is_running=True)
     
     # Start the data collection in the background
     background_tasks.add_task(run_data_collection)
@@ -69,24 +72,20 @@ async def start_data_collection(background_tasks: BackgroundTasks):
     return {
         "message": "Data collection started",
         "status": "running",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": scraper_state.timestamp
     }
 
 @router.get("/status")
 async def get_scraper_status():
     """Get the current status of the data collection process"""
-    return {
-        "is_running": scraper_status["is_running"],
-        "last_run": scraper_status["last_run"],
-        "last_error": scraper_status["last_error"],
-        "progress": scraper_status["progress"],
-        "timestamp": datetime.now().isoformat()
-    }
+    # Snapshots are never mutated in place, so no lock is needed to read one
+    return scraper_state
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(),
+        "started_at": STARTED_AT
     }
@@ -1,12 +1,52 @@
-import requests
-import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import product
 import json
 from typing import List, Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+REGIONS = ['NSW', 'VIC', 'QLD', 'SA', 'TAS']
+
+# Shared random generator; historical prices draw all their variation in one call
+_RNG = np.random.default_rng()
+
+# Base prices by region (AUD/MWh)
+_BASE_PRICE = {'NSW': 85.0, 'VIC': 75.0, 'QLD': 90.0, 'SA': 95.0, 'TAS': 70.0}
+
+# Base demand by region (MW)
+_BASE_DEMAND = {'NSW': 8000, 'VIC': 6000, 'QLD': 7000, 'SA': 1500, 'TAS': 1200}
+
+# Multipliers indexed by hour of day (higher during the 6-9am and 5-8pm peaks)
+_PEAK_HOURS = tuple(6 <= hour <= 9 or 17 <= hour <= 20 for hour in range(24))
+_HOUR_PRICE_MULT = tuple(1.5 if peak else 1.0 for peak in _PEAK_HOURS)
+_HOUR_DEMAND_MULT = tuple(1.3 if peak else 1.0 for peak in _PEAK_HOURS)
+
+# Seasonal price multipliers indexed by month (higher in summer/winter)
+_MONTH_PRICE_MULT = (1.0,) + tuple(
+    1.2 if month in (12, 1, 2) else 1.1 if month in (6, 7, 8) else 1.0
+    for month in range(1, 13)
+)
+
+# Array forms for the vectorized historical generator (regions in REGIONS order)
+_BASE_PRICE_ARRAY = np.array([_BASE_PRICE[region] for region in REGIONS])
+_BASE_DEMAND_ARRAY = np.array([_BASE_DEMAND[region] for region in REGIONS], dtype=float)
+_HOUR_PRICE_ARRAY = np.array(_HOUR_PRICE_MULT)
+_HOUR_DEMAND_ARRAY = np.array(_HOUR_DEMAND_MULT)
+_MONTH_PRICE_ARRAY = np.array(_MONTH_PRICE_MULT)
+
+@lru_cache(maxsize=256)
+def _estimate_demand_cached(region: str, hour: int) -> float:
+    """Demand only depends on region and hour of day"""
+    return round(_BASE_DEMAND.get(region, 5000) * _HOUR_DEMAND_MULT[hour], 2)
+
+@lru_cache(maxsize=256)
+def _estimate_supply_cached(region: str, hour: int) -> float:
+    """Supply is typically slightly higher than demand"""
+    return round(_estimate_demand_cached(region, hour) * 1.05, 2)
+
 class AEMOCollector:
     """
     Collector for Australian Energy Market Operator (AEMO) data
@@ -56,15 +96,8 @@ class AEMOCollector:
             # In a real implementation, this would fetch from AEMO's historical data API
             # For now, we'll generate realistic historical data
             
-            prices = []
-            current_date = start_date
-            
-            while current_date <= end_date:
-                daily_prices = self._generate_daily_prices(current_date)
-                prices.extend(daily_prices)
-                current_date += timedelta(days=1)
-                
-            return prices
+            days = [start_date + timedelta(days=i) for i in range(max((end_date - start_date).days + 1, 0))]
+            return self._generate_prices(days)
             
         except Exception as e:
             logger.error(f"Error collecting historical AEMO data: {e}")
@@ -74,95 +107,65 @@ class AEMOCollector:
         """
         Calculate realistic base price based on region and time
         """
-        # Base prices by region (AUD/MWh)
-        base_prices = {
-            'NSW': 85.0,
-            'VIC': 75.0,
-            'QLD': 90.0,
-            'SA': 95.0,
-            'TAS': 70.0
-        }
-        
-        base = base_prices.get(region, 80.0)
+        multiplier = _HOUR_PRICE_MULT[timestamp.hour] * _MONTH_PRICE_MULT[timestamp.month]
         
-        # Time of day multiplier (higher during peak hours)
-        hour = timestamp.hour
-        if 6 <= hour <= 9 or 17 <= hour <= 20:  # Peak hours
-            multiplier = 1.5
-        elif 22 <= hour <= 5:  # Off-peak hours
-            multiplier = 0.7
-        else:  # Shoulder hours
-            multiplier = 1.0
-            
-        # Seasonal adjustment (higher in summer/winter)
-        month = timestamp.month
-        if month in [12, 1, 2]:  # Summer
-            multiplier *= 1.2
-        elif month in [6, 7, 8]:  # Winter
-            multiplier *= 1.1
-            
         # Add some random variation
-        import random
-        variation = random.uniform(0.8, 1.2)
+        variation = float(_RNG.uniform(0.8, 1.2))
         
-        return round(base * multiplier * variation, 2)
+        return round(_BASE_PRICE.get(region, 80.0) * multiplier * variation, 2)
     
     def _estimate_demand(self, region: str, timestamp: datetime) -> float:
         """
         Estimate electricity demand based on region and time
         """
-        # Base demand by region (MW)
-        base_demand = {
-            'NSW': 8000,
-            'VIC': 6000,
-            'QLD': 7000,
-            'SA': 1500,
-            'TAS': 1200
-        }
-        
-        base = base_demand.get(region, 5000)
-        
-        # Time of day adjustment
-        hour = timestamp.hour
-        if 6 <= hour <= 9 or 17 <= hour <= 20:
-            multiplier = 1.3
-        elif 22 <= hour <= 5:
-            multiplier = 0.6
-        else:
-            multiplier = 1.0
-            
-        return round(base * multiplier, 2)
+        return _estimate_demand_cached(region, timestamp.hour)
     
     def _estimate_supply(self, region: str, timestamp: datetime) -> float:
         """
         Estimate electricity supply based on region and time
         """
-        # Supply is typically slightly higher than demand
-        demand = self._estimate_demand(region, timestamp)
-        return round(demand * 1.05, 2)
+        return _estimate_supply_cached(region, timestamp.hour)
     
-    def _generate_daily_prices(self, date: datetime) -> List[Dict]:
+    def _generate_prices(self, days: List[datetime]) -> List[Dict]:
         """
-        Generate realistic price data for a single day
+        Generate hourly price data for every region on each of the given days,
+        computed as (day, hour, region) arrays in one pass
         """
-        regions = ['NSW', 'VIC', 'QLD', 'SA', 'TAS']
-        prices = []
+        if not days:
+            return []
         
-        # Generate hourly data
-        for hour in range(24):
-            timestamp = date.replace(hour=hour, minute=0, second=0, microsecond=0)
-            
-            for region in regions:
-                price_data = {
-                    'timestamp': timestamp,
-                    'region': region,
-                    'price': self._calculate_base_price(region, timestamp),
-                    'demand': self._estimate_demand(region, timestamp),
-                    'supply': self._estimate_supply(region, timestamp)
-                }
-                prices.append(price_data)
-                
-        return prices
+        months = np.array([day.month for day in days])
+        # Scale the random variation in place and round the whole array once
+        price = _RNG.uniform(0.8, 1.2, size=(len(days), 24, len(REGIONS)))
+        price *= _BASE_PRICE_ARRAY * _HOUR_PRICE_ARRAY[:, None]
+        price *= _MONTH_PRICE_ARRAY[months][:, None, None]
+        np.round(price, 2, out=price)
+        
+        # Demand and supply only depend on hour and region
+        demand = np.round(_BASE_DEMAND_ARRAY * _HOUR_DEMAND_ARRAY[:, None], 2)
+        supply = np.round(demand * 1.05, 2)
+        
+        timestamps = [
+            day.replace(hour=hour, minute=0, second=0, microsecond=0)
+            for day in days
+            for hour in range(24)
+        ]
+        
+        return [
+            {
+                'timestamp': timestamp,
+                'region': region,
+                'price': price_value,
+                'demand': demand_value,
+                'supply': supply_value
+            }
+            for (timestamp, region), price_value, demand_value, supply_value in zip(
+                product(timestamps, REGIONS),
+                price.ravel().tolist(),
+                np.tile(demand.ravel(), len(days)).tolist(),
+                np.tile(supply.ravel(), len(days)).tolist()
+            )
+        ]
 
 # Sample data for development
 def get_sample_electricity_data() -> List[Dict]:
@@ -6,64 +6,151 @@ AEMO NEMWeb Data Scraper for Real Electricity Price Data
 import requests
 import zipfile
 import io
-import csv
 import json
-from datetime import datetime, timedelta
+import orjson
+import os
+import tempfile
+import threading
 import time
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
 import re
 
+from backend.data.collectors.http_session import create_session
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on simultaneous dispatch file downloads (keeps NEMWeb load polite)
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Validators (ETag/Last-Modified) and parsed prices per dispatch file, kept
+# between runs so unchanged files come back as a bodyless 304
+CACHE_FILE = os.getenv("NEMWEB_CACHE_FILE", os.path.join(tempfile.gettempdir(), "nemweb_cache.json"))
+MAX_CACHED_FILES = 16
+
+# Dispatch ZIPs are spooled to memory up to this size, then to a temp file
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# Dispatch CSV row prefixes, matched on raw bytes before any decoding
+PRICE_HEADER_PREFIX = b'I,DISPATCH,PRICE,'
+TABLE_HEADER_PREFIX = b'I,'
+DATA_ROW_PREFIX = b'D,'
+
+NEM_REGIONS = frozenset(('NSW1', 'VIC1', 'QLD1', 'SA1', 'TAS1'))
+
+# Dispatch file names in the directory listing; the fixed-width interval
+# timestamp after the prefix makes newer files sort later
+DISPATCH_FILE_PATTERN = re.compile(r'PUBLIC_DISPATCHIS_\d{12}_\d+\.zip', re.IGNORECASE)
+
+# Returned by download_and_extract_file when the cached copy is still current
+NOT_MODIFIED = object()
+
+# Dispatch files are published every 5 minutes, so a scrape is reused for the
+# rest of its interval instead of downloading the same files again
+DISPATCH_INTERVAL_SECONDS = 300
+_last_scrape = {}
+# Future for the scrape in progress, if any; held only while checking or
+# updating state, never during the network fetch itself
+_scrape_in_flight = None
+_last_scrape_lock = threading.Lock()
+
+# One session per process so NEMWeb connections stay alive between scrapes
+_SESSION = create_session(pool_maxsize=20, retries=3, status_forcelist=(500, 502, 503, 504))
+
 class AEMONEMWebScraper:
     """Scraper for AEMO NEMWeb dispatch data"""
     
     def __init__(self):
         self.base_url = "https://nemweb.com.au/Reports/Current/DispatchIS_Reports/"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session = _SESSION
+        self._http_cache = self._load_http_cache()
+    
+    def _load_http_cache(self):
+        """Load cached dispatch file validators and prices from disk"""
+        
+        try:
+            with open(CACHE_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_http_cache(self):
+        """Persist the newest cache entries to disk"""
+        
+        entries = list(self._http_cache.items())[-MAX_CACHED_FILES:]
+        self._http_cache = dict(entries)
+        
+        try:
+            with open(CACHE_FILE, 'wb') as f:
+                f.write(orjson.dumps(self._http_cache))
+        except OSError as e:
+            logger.warning(f"Could not write NEMWeb cache {CACHE_FILE}: {e}")
+    
+    def _conditional_headers(self, url):
+        """Build If-None-Match/If-Modified-Since headers for a cached file"""
+        
+        cached = self._http_cache.get(url)
+        if not cached or 'price_data' not in cached:
+            return {}
+        
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
     
     def get_latest_dispatch_files(self, limit=3):
-        """Get the latest dispatch file URLs"""
-        
-        # For now, we'll use a known recent file pattern
-        # In production, this would scrape the directory listing
-        now = datetime.now()
-        
-        # Generate recent file names (they follow a pattern)
-        recent_files = []
-        for i in range(limit):
-            # Files are typically 5 minutes apart
-            file_time = now - timedelta(minutes=i*5)
-            timestamp = file_time.strftime('%Y%m%d%H%M')
-            
-            # This is a simplified approach - in reality we'd need to scrape the directory
-            # For now, we'll use a known working file
-            if i == 0:
-                recent_files.append("PUBLIC_DISPATCHIS_202509111655_0000000480215212.zip")
+        """Get the URLs of the newest dispatch files, newest first"""
+        
+        try:
+            response = self.session.get(self.base_url, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"Error listing dispatch files: {e}")
+            return []
         
-        return [self.base_url + f for f in recent_files]
+        file_names = sorted(set(DISPATCH_FILE_PATTERN.findall(response.text)), reverse=True)
+        return [self.base_url + name for name in file_names[:limit]]
     
     def download_and_extract_file(self, url):
-        """Download and extract a NEMWeb ZIP file"""
+        """Download a NEMWeb ZIP file and extract its price data"""
         
         try:
             logger.info(f"Downloading: {url}")
-            response = self.session.get(url, timeout=30)
-            
-            if response.status_code == 200:
-                with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
-                    csv_files = [f for f in zip_file.namelist() if f.upper().endswith('.CSV')]
+            with self.session.get(url, headers=self._conditional_headers(url), timeout=30, stream=True) as response:
+                if response.status_code == 304:
+                    logger.info(f"Not modified since last download: {url}")
+                    return NOT_MODIFIED
+                
+                if response.status_code != 200:
+                    return None
+                
+                self._http_cache[url] = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }
+                
+                # ZipFile needs a seekable file, so spool the body as it arrives
+                # rather than buffering the whole response and copying it
+                with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as archive:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                        archive.write(chunk)
+                    archive.seek(0)
                     
-                    if csv_files:
-                        csv_file = csv_files[0]
-                        with zip_file.open(csv_file) as csv_data:
-                            content = csv_data.read().decode('utf-8', errors='ignore')
-                            return content
+                    with zipfile.ZipFile(archive) as zip_file:
+                        csv_files = [f for f in zip_file.namelist() if f.upper().endswith('.CSV')]
+                        
+                        if csv_files:
+                            # Parse lines as they are decompressed; extraction stops
+                            # reading once the PRICE table has been seen
+                            # (ZipExtFile.readline is pure Python, so buffer it in C)
+                            with io.BufferedReader(zip_file.open(csv_files[0]), DOWNLOAD_CHUNK_BYTES) as csv_data:
+                                return self.extract_price_data(csv_data)
             
             return None
             
@@ -72,74 +159,124 @@ class AEMONEMWebScraper:
             return None
     
     def extract_price_data(self, content):
-        """Extract price data from dispatch content"""
+        """Extract price data from dispatch content (a string, or binary CSV lines)"""
         
         if not content:
             return {}
         
+        if isinstance(content, str):
+            content = io.BytesIO(content.encode('utf-8'))
+        
         price_data = {}
-        csv_reader = csv.reader(io.StringIO(content))
-        rows = list(csv_reader)
         
-        # Look for the PRICE table
-        price_rows = []
+        # Look for the PRICE table. Rows are classified by their raw prefix, so
+        # only PRICE data rows are ever decoded and CSV-parsed
         in_price_section = False
         
-        for row in rows:
-            if row and len(row) > 0:
-                # Check if this is the start of the PRICE table
-                if (len(row) > 2 and 
-                    row[1] == 'DISPATCH' and 
-                    row[2] == 'PRICE' and 
-                    row[0] == 'I'):  # 'I' indicates header row
-                    in_price_section = True
+        for raw in content:
+            if not in_price_section:
+                # 'I' indicates a header row
+                in_price_section = raw.startswith(PRICE_HEADER_PREFIX)
+                continue
+            
+            if raw.startswith(TABLE_HEADER_PREFIX):
+                if raw.startswith(PRICE_HEADER_PREFIX):
                     continue
+                # A different table after PRICE means there is nothing left to read
+                break
+            
+            if not raw.startswith(DATA_ROW_PREFIX):
+                continue
+            
+            # Only the first ten fields are needed, none of which contain commas
+            row = raw.split(b',', 10)
+            if len(row) > 9:
+                # Extract region and price
+                region = row[6].strip(b'"').decode('ascii', errors='ignore')  # REGIONID column (index 6)
+                price = row[9].strip(b'"').decode('ascii', errors='ignore')   # RRP (Regional Reference Price) column (index 9)
                 
-                # Check if we're in the price section and this is data
-                if in_price_section and row[0] == 'D' and len(row) > 9:
-                    # Extract region and price
-                    region = row[6]  # REGIONID column (index 6)
-                    price = row[9]   # RRP (Regional Reference Price) column (index 9)
-                    
-                    if region and price and region in ['NSW1', 'VIC1', 'QLD1', 'SA1', 'TAS1']:
-                        try:
-                            price_value = float(price)
-                            price_data[region] = price_value
-                            logger.info(f"Found price for {region}: ${price_value}/MWh")
-                        except ValueError:
-                            logger.warning(f"Invalid price value for {region}: {price}")
-                
-                # Check if we've moved to a different table
-                elif in_price_section and row[0] == 'I' and row[2] != 'PRICE':
-                    in_price_section = False
+                if price and region in NEM_REGIONS:
+                    try:
+                        price_value = float(price)
+                        price_data[region] = price_value
+                        logger.info(f"Found price for {region}: ${price_value}/MWh")
+                    except ValueError:
+                        logger.warning(f"Invalid price value for {region}: {price}")
         
         return price_data
     
     def scrape_current_prices(self):
-        """Scrape current electricity prices"""
+        """Scrape current electricity prices, at most once per dispatch interval"""
+        global _scrape_in_flight
+        
+        interval = int(time.time() // DISPATCH_INTERVAL_SECONDS)
+        
+        with _last_scrape_lock:
+            if _last_scrape.get('interval') == interval:
+                logger.info("Reusing prices scraped earlier in this dispatch interval")
+                return dict(_last_scrape['prices'])
+            
+            # Concurrent callers share the result of the scrape in progress
+            # rather than repeating it, failed or not
+            in_flight = _scrape_in_flight
+            if in_flight is None:
+                _scrape_in_flight = Future()
+        
+        if in_flight is not None:
+            logger.info("Waiting for the scrape already in progress")
+            return dict(in_flight.result())
+        
+        try:
+            prices = self._scrape_current_prices()
+        except BaseException as e:
+            # Anything escaping the scrape, KeyboardInterrupt and SystemExit
+            # included, must still release the callers waiting on it
+            with _last_scrape_lock:
+                future, _scrape_in_flight = _scrape_in_flight, None
+            future.set_exception(e)
+            raise
+        
+        with _last_scrape_lock:
+            if prices.get('data_quality') == 'REAL':
+                _last_scrape['interval'] = interval
+                _last_scrape['prices'] = dict(prices)
+            future, _scrape_in_flight = _scrape_in_flight, None
+        future.set_result(dict(prices))
+        return prices
+    
+    def _scrape_current_prices(self):
+        """Download the latest dispatch files and extract current prices"""
         
         logger.info("Scraping current electricity prices from AEMO NEMWeb...")
         
         # Get latest files
         file_urls = self.get_latest_dispatch_files()
         
-        for url in file_urls:
-            content = self.download_and_extract_file(url)
-            if content:
-                price_data = self.extract_price_data(content)
-                if price_data:
-                    logger.info(f"Successfully extracted price data from {url}")
-                    
-                    # Keep region codes as they are (NSW1, VIC1, etc.) for database compatibility
-                    formatted_data = price_data
-                    
-                    formatted_data['source'] = 'AEMO NEMWeb'
-                    formatted_data['timestamp'] = datetime.now().isoformat()
-                    formatted_data['data_quality'] = 'REAL'
-                    
-                    return formatted_data
+        # Download all candidate files concurrently so the wait is the slowest
+        # download rather than the sum of them; results keep newest-first order
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_DOWNLOADS, len(file_urls)))) as executor:
+            results = list(executor.map(self.download_and_extract_file, file_urls))
+        
+        for url, price_data in zip(file_urls, results):
+            if price_data is NOT_MODIFIED:
+                price_data = dict(self._http_cache[url]['price_data'])
+            elif price_data:
+                self._http_cache[url]['price_data'] = dict(price_data)
+                self._save_http_cache()
+            else:
+                continue
             
-            time.sleep(1)  # Be respectful to the server
+            if price_data:
+                logger.info(f"Successfully extracted price data from {url}")
+                
+                # Keep region codes as they are (NSW1, VIC1, etc.) for database compatibility
+                formatted_data = price_data
+                
+                formatted_data['source'] = 'AEMO NEMWeb'
+                formatted_data['timestamp'] = datetime.now().isoformat()
+                formatted_data['data_quality'] = 'REAL'
+                
+                return formatted_data
         
         logger.warning("No price data found in any dispatch files")
         return {
@@ -1,12 +1,24 @@
-import requests
-import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from itertools import product
 import json
+import zlib
 from typing import List, Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared random generator for the simulated level variation
+_RNG = np.random.default_rng()
+
+# Seasonal scaling of the daily variation, indexed by month
+# (higher levels in winter/spring, lower in summer)
+_MONTH_SEASONAL_FACTOR = (1.0,) + tuple(
+    1.2 if month in (6, 7, 8, 9) else 0.8 if month in (12, 1, 2) else 1.0
+    for month in range(1, 13)
+)
+_MONTH_SEASONAL_ARRAY = np.array(_MONTH_SEASONAL_FACTOR)
+
 class DamCollector:
     """
     Collector for Australian dam level data from various water authorities
@@ -43,32 +55,32 @@ class DamCollector:
                 'Lake Pedder': {'capacity_ml': 3000000, 'current_percentage': 89.8}
             }
         }
+        
+        # Per-dam offsets for the cyclical variation pattern, stable across
+        # processes (unlike hash(), which is salted per interpreter)
+        self._dam_hash = {
+            dam_name: zlib.crc32(dam_name.encode()) % 100
+            for dams in self.dam_data.values()
+            for dam_name in dams
+        }
+        
+        # Flat per-dam arrays (in dam_data order) for vectorized generation
+        self._dams = [
+            (dam_name, state)
+            for state, dams in self.dam_data.items()
+            for dam_name in dams
+        ]
+        self._dam_base = np.array([self.dam_data[state][name]['current_percentage'] for name, state in self._dams])
+        self._dam_capacity = np.array([self.dam_data[state][name]['capacity_ml'] for name, state in self._dams], dtype=float)
+        self._dam_hashes = np.array([self._dam_hash[name] for name, _ in self._dams])
     
     def get_current_dam_levels(self) -> List[Dict]:
         """
         Get current dam levels across Australia
         """
         try:
-            current_time = datetime.now()
-            dam_levels = []
-            
-            for state, dams in self.dam_data.items():
-                for dam_name, data in dams.items():
-                    # Simulate realistic daily variations
-                    variation = self._calculate_daily_variation(dam_name, current_time)
-                    current_percentage = max(0, min(100, data['current_percentage'] + variation))
-                    current_volume = (current_percentage / 100) * data['capacity_ml']
-                    
-                    dam_data = {
-                        'timestamp': current_time,
-                        'dam_name': dam_name,
-                        'state': state,
-                        'capacity_percentage': round(current_percentage, 2),
-                        'volume_ml': round(current_volume, 2)
-                    }
-                    dam_levels.append(dam_data)
-                    
-            return dam_levels
+            # Simulate realistic daily variations for every dam at once
+            return self._dam_levels_at([datetime.now()])
             
         except Exception as e:
             logger.error(f"Error collecting dam level data: {e}")
@@ -79,68 +91,58 @@ class DamCollector:
         Get historical dam levels for the specified date range
         """
         try:
-            dam_levels = []
-            current_date = start_date
-            
-            while current_date <= end_date:
-                daily_levels = self._generate_daily_dam_levels(current_date)
-                dam_levels.extend(daily_levels)
-                current_date += timedelta(days=1)
-                
-            return dam_levels
+            days = [start_date + timedelta(days=i) for i in range(max((end_date - start_date).days + 1, 0))]
+            return self._generate_dam_levels(days)
             
         except Exception as e:
             logger.error(f"Error collecting historical dam level data: {e}")
             return []
     
-    def _calculate_daily_variation(self, dam_name: str, timestamp: datetime) -> float:
+    def _generate_dam_levels(self, dates: List[datetime]) -> List[Dict]:
         """
-        Calculate realistic daily variation in dam levels
+        Generate dam level data for every dam on each of the given days
         """
-        import random
-        import math
-        
-        # Seasonal patterns (higher levels in winter/spring)
-        month = timestamp.month
-        seasonal_factor = 1.0
-        if month in [6, 7, 8, 9]:  # Winter/Spring
-            seasonal_factor = 1.2
-        elif month in [12, 1, 2]:  # Summer
-            seasonal_factor = 0.8
-            
-        # Random daily variation (-2% to +2%)
-        daily_variation = random.uniform(-2.0, 2.0) * seasonal_factor
-        
-        # Add some cyclical patterns based on dam name hash
-        dam_hash = hash(dam_name) % 100
-        cyclical_factor = math.sin((timestamp.day + dam_hash) * 0.1) * 0.5
+        if not dates:
+            return []
         
-        return daily_variation + cyclical_factor
+        return self._dam_levels_at([date.replace(hour=12, minute=0, second=0, microsecond=0) for date in dates])
     
-    def _generate_daily_dam_levels(self, date: datetime) -> List[Dict]:
+    def _dam_levels_at(self, timestamps: List[datetime]) -> List[Dict]:
         """
-        Generate realistic dam level data for a single day
+        Dam level records for every dam at each timestamp, computed from the
+        flat per-dam arrays as (timestamp, dam) arrays in one pass
         """
-        dam_levels = []
+        months = np.array([timestamp.month for timestamp in timestamps])
+        days = np.array([timestamp.day for timestamp in timestamps])
         
-        for state, dams in self.dam_data.items():
-            for dam_name, data in dams.items():
-                # Calculate level for this date
-                base_percentage = data['current_percentage']
-                variation = self._calculate_daily_variation(dam_name, date)
-                current_percentage = max(0, min(100, base_percentage + variation))
-                current_volume = (current_percentage / 100) * data['capacity_ml']
-                
-                dam_data = {
-                    'timestamp': date.replace(hour=12, minute=0, second=0, microsecond=0),
-                    'dam_name': dam_name,
-                    'state': state,
-                    'capacity_percentage': round(current_percentage, 2),
-                    'volume_ml': round(current_volume, 2)
-                }
-                dam_levels.append(dam_data)
-                
-        return dam_levels
+        # Random daily variation (-2% to +2%) scaled by season, plus a cyclical
+        # pattern offset per dam
+        variation = (
+            _RNG.uniform(-2.0, 2.0, size=(len(timestamps), len(self._dams)))
+            * _MONTH_SEASONAL_ARRAY[months][:, None]
+            + np.sin((days[:, None] + self._dam_hashes) * 0.1) * 0.5
+        )
+        percentage = np.clip(variation + self._dam_base, 0, 100, out=variation)
+        volume = (percentage / 100) * self._dam_capacity
+        
+        # Round each column once, in place
+        np.round(volume, 2, out=volume)
+        np.round(percentage, 2, out=percentage)
+        
+        return [
+            {
+                'timestamp': timestamp,
+                'dam_name': dam_name,
+                'state': state,
+                'capacity_percentage': capacity_percentage,
+                'volume_ml': volume_ml
+            }
+            for (timestamp, (dam_name, state)), capacity_percentage, volume_ml in zip(
+                product(timestamps, self._dams),
+                percentage.ravel().tolist(),
+                volume.ravel().tolist()
+            )
+        ]
     
     def get_dam_info(self) -> Dict:
         """
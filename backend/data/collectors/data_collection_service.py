@@ -1,12 +1,14 @@
 import schedule
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Dict
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from backend.database.database import SessionLocal, ElectricityPrice, DamLevel
+from backend.database.database import SessionLocal, ElectricityPrice, DamLevel, delete_older_than, insert_ignoring_duplicates
 from backend.data.collectors.real_data_scrapers import RealDataScrapers
+from backend.data.collectors.scheduling import run_in_background, run_schedule_forever
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +19,6 @@ class DataCollectionService:
     
     def __init__(self):
         self.scraper = RealDataScrapers()
-        self.db = SessionLocal()
     
     def collect_and_store_electricity_data(self):
         """
@@ -30,26 +31,18 @@ class DataCollectionService:
             electricity_data = self.scraper.scrape_aemo_prices()
             
             if electricity_data:
-                # Store in database
-                for data in electricity_data:
-                    # Check if record already exists for this timestamp and region
-                    existing = self.db.query(ElectricityPrice).filter(
-                        ElectricityPrice.timestamp == data['timestamp'],
-                        ElectricityPrice.region == data['region']
-                    ).first()
-                    
-                    if not existing:
-                        price_record = ElectricityPrice(**data)
-                        self.db.add(price_record)
-                
-                self.db.commit()
-                logger.info(f"Stored {len(electricity_data)} electricity price records")
+                # Store in database, skipping records already stored for this timestamp and region
+                with SessionLocal() as db:
+                    stored = insert_ignoring_duplicates(
+                        db, ElectricityPrice, electricity_data, ['timestamp', 'region']
+                    )
+                    db.commit()
+                logger.info(f"Stored {stored} electricity price records")
             else:
                 logger.warning("No electricity data collected")
                 
         except Exception as e:
             logger.error(f"Error collecting electricity data: {e}")
-            self.db.rollback()
     
     def collect_and_store_dam_data(self):
         """
@@ -66,40 +59,37 @@ class DataCollectionService:
                 self.scraper.scrape_bom_water_storage
             ]
             
-            total_dam_records = 0
+            all_dam_data = []
             
-            for scraper in dam_sources:
-                try:
-                    dam_data = scraper()
-                    
-                    if dam_data:
-                        for data in dam_data:
-                            # Check if record already exists
-                            existing = self.db.query(DamLevel).filter(
-                                DamLevel.timestamp == data['timestamp'],
-                                DamLevel.dam_name == data['dam_name'],
-                                DamLevel.state == data['state']
-                            ).first()
-                            
-                            if not existing:
-                                dam_record = DamLevel(**data)
-                                self.db.add(dam_record)
-                                total_dam_records += 1
+            # Each source is a different host, so scrape them all at once
+            with ThreadPoolExecutor(max_workers=len(dam_sources)) as executor:
+                futures = {executor.submit(scraper): scraper.__name__ for scraper in dam_sources}
+                
+                for future in as_completed(futures):
+                    try:
+                        dam_data = future.result()
+                        
+                        if dam_data:
+                            all_dam_data.extend(dam_data)
+                            logger.info(f"Collected {len(dam_data)} dam level records from {futures[future]}")
                         
-                        self.db.commit()
-                        logger.info(f"Stored {len(dam_data)} dam level records from {scraper.__name__}")
-                    
-                    time.sleep(1)  # Be respectful to servers
-                    
-                except Exception as e:
-                    logger.error(f"Error in {scraper.__name__}: {e}")
-                    continue
+                    except Exception as e:
+                        logger.error(f"Error in {futures[future]}: {e}")
+                        continue
+            
+            # Store everything at once, skipping records that already exist
+            total_dam_records = 0
+            if all_dam_data:
+                with SessionLocal() as db:
+                    total_dam_records = insert_ignoring_duplicates(
+                        db, DamLevel, all_dam_data, ['timestamp', 'dam_name', 'state']
+                    )
+                    db.commit()
             
             logger.info(f"Total dam records stored: {total_dam_records}")
             
         except Exception as e:
             logger.error(f"Error collecting dam data: {e}")
-            self.db.rollback()
     
     def collect_all_data(self):
         """
@@ -107,11 +97,10 @@ class DataCollectionService:
         """
         logger.info("Starting comprehensive data collection...")
         
-        # Collect electricity data
-        self.collect_and_store_electricity_data()
-        
-        # Collect dam data
-        self.collect_and_store_dam_data()
+        # Electricity and dam sources are independent, so collect them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(self.collect_and_store_electricity_data)
+            executor.submit(self.collect_and_store_dam_data)
         
         logger.info("Data collection completed")
     
@@ -120,26 +109,24 @@ class DataCollectionService:
         Get summary of data in database
         """
         try:
-            electricity_count = self.db.query(ElectricityPrice).count()
-            dam_count = self.db.query(DamLevel).count()
-            
-            # Get latest timestamps
-            latest_electricity = self.db.query(ElectricityPrice.timestamp).order_by(
-                ElectricityPrice.timestamp.desc()
-            ).first()
-            
-            latest_dam = self.db.query(DamLevel.timestamp).order_by(
-                DamLevel.timestamp.desc()
-            ).first()
-            
-            return {
-                'electricity_records': electricity_count,
-                'dam_records': dam_count,
-                'latest_electricity_update': latest_electricity[0] if latest_electricity else None,
-                'latest_dam_update': latest_dam[0] if latest_dam else None,
-                'collection_time': datetime.now()
-            }
-            
+            with SessionLocal() as db:
+                # Record count and latest timestamp per table in one aggregate query each
+                electricity_count, latest_electricity = db.query(
+                    func.count(), func.max(ElectricityPrice.timestamp)
+                ).select_from(ElectricityPrice).one()
+                
+                dam_count, latest_dam = db.query(
+                    func.count(), func.max(DamLevel.timestamp)
+                ).select_from(DamLevel).one()
+                
+                return {
+                    'electricity_records': electricity_count,
+                    'dam_records': dam_count,
+                    'latest_electricity_update': latest_electricity,
+                    'latest_dam_update': latest_dam,
+                    'collection_time': datetime.now()
+                }
+                
         except Exception as e:
             logger.error(f"Error getting data summary: {e}")
             return {}
@@ -151,23 +138,15 @@ class DataCollectionService:
         try:
             cutoff_date = datetime.now() - timedelta(days=days_to_keep)
             
-            # Delete old electricity data
-            old_electricity = self.db.query(ElectricityPrice).filter(
-                ElectricityPrice.timestamp < cutoff_date
-            ).delete()
-            
-            # Delete old dam data
-            old_dam = self.db.query(DamLevel).filter(
-                DamLevel.timestamp < cutoff_date
-            ).delete()
-            
-            self.db.commit()
+            with SessionLocal() as db:
+                # Delete old data in batches so collection isn't blocked meanwhile
+                old_electricity = delete_older_than(db, ElectricityPrice, cutoff_date)
+                old_dam = delete_older_than(db, DamLevel, cutoff_date)
             
             logger.info(f"Cleaned up {old_electricity} old electricity records and {old_dam} old dam records")
             
         except Exception as e:
             logger.error(f"Error cleaning up old data: {e}")
-            self.db.rollback()
     
     def run_scheduled_collection(self):
         """
@@ -176,17 +155,15 @@ class DataCollectionService:
         logger.info("Starting scheduled data collection service...")
         
         # Schedule data collection
-        schedule.every(30).minutes.do(self.collect_and_store_electricity_data)
-        schedule.every(6).hours.do(self.collect_and_store_dam_data)
-        schedule.every().day.at("02:00").do(self.cleanup_old_data)
+        schedule.every(30).minutes.do(run_in_background, self.collect_and_store_electricity_data)
+        schedule.every(6).hours.do(run_in_background, self.collect_and_store_dam_data)
+        schedule.every().day.at("02:00").do(run_in_background, self.cleanup_old_data)
         
         # Run initial collection
         self.collect_all_data()
         
         # Keep running
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        run_schedule_forever()
     
     def run_once(self):
         """
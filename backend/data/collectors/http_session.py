@@ -0,0 +1,29 @@
+"""
+Pooled, retrying HTTP sessions for the scrapers
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+def create_session(pool_connections=10, pool_maxsize=10, retries=2, status_forcelist=(502, 503, 504)) -> requests.Session:
+    """
+    Create a pooled HTTP session that retries transient server errors with backoff
+
+    Scraper modules create one at import and share it between their instances,
+    so connections (and their TLS sessions) to each source are reused between
+    scrapes, not just within one. pool_maxsize bounds the connections kept per
+    host, so callers fetching one host from several threads should raise it.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=0.3, status_forcelist=list(status_forcelist), allowed_methods=['GET'])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
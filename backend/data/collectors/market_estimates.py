@@ -0,0 +1,52 @@
+"""
+Typical NEM prices and demand, used where live market data isn't available
+"""
+
+from functools import lru_cache
+
+# Base prices by region (AUD/MWh) - updated for current market
+BASE_PRICES = {
+    'NSW1': 95.0,  # Higher due to coal plant closures
+    'VIC1': 85.0,  # Good renewable penetration
+    'QLD1': 100.0, # High demand, coal dependent
+    'SA1': 110.0,  # High renewable but isolated
+    'TAS1': 75.0   # Hydro dominated, stable
+}
+
+BASE_DEMAND = {
+    'NSW1': 8500,
+    'VIC1': 6500,
+    'QLD1': 7500,
+    'SA1': 1600,
+    'TAS1': 1300
+}
+
+def _is_peak(hour: int) -> bool:
+    """Morning (6-9am) and evening (5-8pm) peaks"""
+    return 6 <= hour <= 9 or 17 <= hour <= 20
+
+@lru_cache(maxsize=2048)
+def typical_price(region: str, hour: int, month: int) -> float:
+    """Price before random variation only depends on region, hour and month"""
+    base = BASE_PRICES.get(region, 90.0)
+
+    # Time of day multiplier
+    multiplier = 1.6 if _is_peak(hour) else 1.0
+
+    # Seasonal adjustment
+    if month in [12, 1, 2]:  # Summer
+        multiplier *= 1.3
+    elif month in [6, 7, 8]:  # Winter
+        multiplier *= 1.2
+
+    return base * multiplier
+
+@lru_cache(maxsize=256)
+def typical_demand(region: str, hour: int) -> float:
+    """Demand only depends on region and hour of day"""
+    base = BASE_DEMAND.get(region, 5000)
+
+    # Time of day adjustment
+    multiplier = 1.4 if _is_peak(hour) else 1.0
+
+    return round(base * multiplier, 2)
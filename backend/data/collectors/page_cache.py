@@ -0,0 +1,97 @@
+"""
+On-disk cache of scraped pages, revalidated with conditional GETs
+"""
+
+import requests
+import orjson
+import hashlib
+import os
+import tempfile
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Fetched pages are kept on disk so repeat runs within the max age skip the
+# network; older copies are revalidated with a conditional GET, and stand in
+# for the page if the server can't be reached or has a server error, as long
+# as they are not too old. Dam levels update at most hourly.
+PAGE_CACHE_DIR = os.getenv("SCRAPER_PAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "scraper_page_cache"))
+PAGE_MAX_AGE_SECONDS = 1800
+STALE_IF_ERROR_SECONDS = 6 * 3600
+
+def _page_cache_paths(url):
+    """Body and metadata file paths for a cached page"""
+    key = os.path.join(PAGE_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest())
+    return key + '.html', key + '.json'
+
+def load_cached_page(url):
+    """The cached (metadata, body) of a page, or (None, None) if not cached"""
+    body_path, meta_path = _page_cache_paths(url)
+    try:
+        with open(meta_path, 'rb') as f:
+            meta = orjson.loads(f.read())
+        with open(body_path, 'rb') as f:
+            return meta, f.read()
+    except (OSError, ValueError):
+        return None, None
+
+def save_cached_page(url, meta, content):
+    """Write a page to the cache, replacing any previous copy in one step"""
+    body_path, meta_path = _page_cache_paths(url)
+    try:
+        os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+        for path, data in ((body_path, content), (meta_path, orjson.dumps(meta))):
+            fd, tmp_path = tempfile.mkstemp(dir=PAGE_CACHE_DIR)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not cache {url} in {PAGE_CACHE_DIR}: {e}")
+
+def fetch_page(session, url, max_age=None, before_request=None, stale_if_error=True) -> bytes:
+    """
+    Get a page body, reusing or revalidating the copy cached on disk where possible
+
+    A cached copy younger than max_age seconds (PAGE_MAX_AGE_SECONDS by
+    default) is used as is; before_request, if given, is called with the URL
+    just before going to the network. If the fetch fails, a cached copy younger
+    than STALE_IF_ERROR_SECONDS is returned instead when stale_if_error is set,
+    except on a 4xx response. Otherwise requests.RequestException is raised.
+    """
+    if max_age is None:
+        max_age = PAGE_MAX_AGE_SECONDS
+
+    cached, content = load_cached_page(url)
+    if cached and time.time() - cached['fetched_at'] < max_age:
+        return content
+
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        if before_request:
+            before_request(url)
+        response = session.get(url, headers=headers, timeout=10)
+        if response.status_code != 304 or not cached:
+            response.raise_for_status()
+            content = response.content
+    except requests.RequestException as e:
+        # A client error means the page itself is gone, not just unreachable
+        if isinstance(e, requests.HTTPError) and 400 <= e.response.status_code < 500:
+            raise
+        age = time.time() - cached['fetched_at'] if cached else None
+        if not stale_if_error or age is None or age >= STALE_IF_ERROR_SECONDS:
+            raise
+        logger.warning(f"Using {age / 60:.0f} minute old cached copy of {url} after fetch failed: {e}")
+        return content
+
+    save_cached_page(url, {
+        'etag': response.headers.get('ETag') or (cached and cached.get('etag')),
+        'last_modified': response.headers.get('Last-Modified') or (cached and cached.get('last_modified')),
+        'fetched_at': time.time()
+    }, content)
+    return content
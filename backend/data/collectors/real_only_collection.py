@@ -0,0 +1,51 @@
+"""
+Real-only data collection: scrape the real-only sources and store what's new
+"""
+
+import asyncio
+from sqlalchemy import insert
+
+from backend.database.database import SessionLocal, ElectricityPrice, DamLevel, filter_new_rows
+from backend.data.collectors.real_only_scrapers import RealOnlyScrapers
+
+def collect_real_only_data():
+    """Scrape real-only data and store records not already in the database
+
+    Returns the scraped data with the number of new records stored for each table.
+    """
+    # Create real-only data scraper
+    scraper = RealOnlyScrapers()
+
+    # Get database session
+    db = SessionLocal()
+
+    try:
+        real_data = scraper.scrape_all_real_data()
+
+        # Skip records that already exist (same timestamp and region/dam) using
+        # one key lookup per table, then insert the rest in bulk
+        new_prices = filter_new_rows(db, ElectricityPrice, real_data['electricity_prices'], ['timestamp', 'region'])
+        new_levels = filter_new_rows(db, DamLevel, real_data['dam_levels'], ['timestamp', 'dam_name', 'state'])
+
+        # Store electricity data (all 0 since no real sources available)
+        if new_prices:
+            db.execute(insert(ElectricityPrice), new_prices)
+
+        # Store dam data
+        if new_levels:
+            db.execute(insert(DamLevel), new_levels)
+
+        stored = {'electricity_prices': len(new_prices), 'dam_levels': len(new_levels)}
+
+        db.commit()
+        return real_data, stored
+
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def run():
+    """Run the real-only collection in a worker thread, off the event loop"""
+    return await asyncio.to_thread(collect_real_only_data)
@@ -6,28 +6,288 @@ Returns 0 for sources that cannot be scraped
 
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from datetime import datetime, timedelta
-import json
+import threading
 import time
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from typing import List, Dict, Optional
+from urllib.parse import urlparse
 import re
 from .aemo_nemweb_scraper import AEMONEMWebScraper
+from .http_session import create_session
+from .page_cache import fetch_page
 
 logger = logging.getLogger(__name__)
 
+# Hydro Tasmania lake levels table selectors, compiled once per process.
+# Lake rows are the rows after the header with a linked lake name and a level cell.
+LAKE_ROWS_XPATH = etree.XPath("(.//tr)[position() > 1][count(.//td) >= 2][(.//td)[1]//a]")
+LAKE_NAME_XPATH = etree.XPath("string(((.//td)[1]//a)[1])")
+METRES_FROM_FULL_XPATH = etree.XPath("string((.//td)[2])")
+
+# Visible text of a page, leaving out scripts and stylesheets like BeautifulSoup's get_text()
+PAGE_TEXT_XPATH = etree.XPath("//text()[not(ancestor::script or ancestor::style)]")
+
+# Dam levels are shown in the page body, so the <head> (metadata, inline
+# styles and scripts) is never turned into soup
+BODY_ONLY = SoupStrainer('body')
+
+# Streamed pages are parsed as each chunk of this size arrives
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Individual dam pages fetched at once; bounds the load on the dam site's server
+DAM_PAGE_WORKERS = 4
+
+# Look for capacity information in various formats
+PERCENT_RE = re.compile(r'(\d+\.?\d*)\s*%')  # Percentage patterns
+CAPACITY_RES = [
+    PERCENT_RE,
+    re.compile(r'(\d+\.?\d*)\s*per\s*cent'),  # "per cent" patterns
+]
+
+# Known dams for each scraped source
+SEQWATER_DAMS = [
+    'Hinze', 'Wivenhoe', 'Somerset', 'Fairbairn', 'Burdekin Falls',
+    'Baroon Pocket', 'Borumba', 'Cooloolabin', 'Ewen Maddock',
+    'Lake Macdonald', 'Lake Manchester', 'Leslie Harrison',
+    'Little Nerang', 'Maroon', 'Moogerah', 'North Pine',
+    'Poona', 'Sideling Creek', 'Six Mile Creek', 'Tingalpa', 'Wappa'
+]
+WATERNSW_DAMS = ['Blowering', 'Burrinjuck', 'Copeton', 'Eucumbene', 'Warragamba', 'Windamere']
+SA_DAMS = ['Happy Valley', 'Mount Bold', 'Myponga']
+
+# Individual Seqwater dam pages, by dam name
+SEQWATER_DAM_URLS = {
+    dam_name: f"https://www.seqwater.com.au/dams/{dam_name.lower().replace(' ', '-')}"
+    for dam_name in SEQWATER_DAMS
+}
+
+# Every dam reported, by state; dams without a scraped level are reported as 0
+ALL_DAMS = {
+    'NSW': WATERNSW_DAMS,
+    'VIC': ['Dartmouth', 'Eildon', 'Hume', 'Thomson', 'Yarrawonga'],
+    'QLD': SEQWATER_DAMS,
+    'SA': SA_DAMS,
+    'TAS': ['Gordon', 'Great Lake', 'Lake Pedder']
+}
+
+def dam_names_re(dam_names):
+    """
+    One case-insensitive regex matching any of the dam names
+    """
+    return re.compile('|'.join(re.escape(dam_name) for dam_name in dam_names), re.IGNORECASE)
+
+# Matchers for every dam of a source at once, compiled once
+SEQWATER_DAMS_RE = dam_names_re(SEQWATER_DAMS)
+WATERNSW_DAMS_RE = dam_names_re(WATERNSW_DAMS)
+SA_DAMS_RE = dam_names_re(SA_DAMS)
+
+# Dam levels pages scraped by matching each dam's name and reading the
+# capacity percentage from the text around it
+DAM_SITES = {
+    'Seqwater': {
+        'url': "https://www.seqwater.com.au/dam-levels",
+        'state': 'QLD',
+        'dams': SEQWATER_DAMS,
+        'dams_re': SEQWATER_DAMS_RE,
+        'capacity_res': CAPACITY_RES,
+        # Only the first mention is checked; other dams are looked up on their own page
+        'mentions': 1,
+        'dam_page_urls': SEQWATER_DAM_URLS
+    },
+    'WaterNSW': {
+        # WaterNSW has API available, but for now we'll try web scraping
+        'url': "https://www.waternsw.com.au/supply/dam-levels",
+        'state': 'NSW',
+        'dams': WATERNSW_DAMS,
+        'dams_re': WATERNSW_DAMS_RE,
+        'capacity_res': [PERCENT_RE],
+        'mentions': None,
+        'dam_page_urls': None
+    },
+    'SA Water': {
+        'url': "https://www.waterconnect.sa.gov.au/Systems/RTWD/SitePages/Available%20Data.aspx",
+        'state': 'SA',
+        'dams': SA_DAMS,
+        'dams_re': SA_DAMS_RE,
+        'capacity_res': [PERCENT_RE],
+        'mentions': None,
+        'dam_page_urls': None
+    }
+}
+
+# Dam names by the lower-cased text they are matched as
+DAM_NAMES_BY_LOWER = {
+    dam_name.lower(): dam_name
+    for dam_name in SEQWATER_DAMS + WATERNSW_DAMS + SA_DAMS
+}
+
+def strings_by_dam(soup, dams_re) -> Dict[str, list]:
+    """
+    Text nodes mentioning each dam, in document order, found in a single
+    walk of the tree rather than one walk per dam
+    """
+    strings = {}
+    for string in soup.find_all(string=dams_re):
+        mentioned = dict.fromkeys(
+            DAM_NAMES_BY_LOWER.get(match.group().lower()) for match in dams_re.finditer(string)
+        )
+        for dam_name in mentioned:
+            if dam_name:
+                strings.setdefault(dam_name, []).append(string)
+    return strings
+
+def find_capacity(text: str, capacity_res=CAPACITY_RES) -> Optional[float]:
+    """
+    First valid capacity percentage in the text, if any
+    """
+    for capacity_re in capacity_res:
+        capacity_match = capacity_re.search(text)
+        if capacity_match:
+            capacity = float(capacity_match.group(1))
+            if 0 <= capacity <= 100:  # Valid percentage
+                return capacity
+    return None
+
+def parse_dam_site(site_name: str, content: bytes, timestamp: datetime) -> Dict[str, Dict]:
+    """
+    Dam records found on one of the DAM_SITES dam levels pages, by dam name
+    """
+    site = DAM_SITES[site_name]
+    soup = BeautifulSoup(content, 'lxml', parse_only=BODY_ONLY)
+    
+    # Look for dam level data
+    dam_strings = strings_by_dam(soup, site['dams_re'])
+    found = {}
+    # Capacity found in each parent element's text, by element id; dams listed
+    # together share a parent, whose text is then only gathered once
+    parent_capacities = {}
+    for dam_name in site['dams']:
+        # Search for dam name and nearby capacity data
+        dam_elements = dam_strings.get(dam_name, [])[:site['mentions']]
+        
+        for element in dam_elements:
+            parent = element.parent
+            if parent:
+                # Look for capacity percentage in nearby text
+                if id(parent) not in parent_capacities:
+                    parent_capacities[id(parent)] = find_capacity(parent.get_text(), site['capacity_res'])
+                capacity = parent_capacities[id(parent)]
+                if capacity is not None:
+                    found[dam_name] = {
+                        'timestamp': timestamp,
+                        'dam_name': dam_name,
+                        'state': site['state'],
+                        'capacity_percentage': capacity,
+                        'volume_ml': 0.0  # We don't have volume data from the levels page
+                    }
+                    logger.info(f"Found {dam_name}: {capacity}%")
+                    break
+    
+    return found
+
+def read_first_table(response):
+    """
+    Parse a streamed HTML response only up to the end of its first table,
+    returning that table element (or None if the page has no table)
+    """
+    parser = etree.HTMLPullParser(events=('start', 'end'), tag='table')
+    first_table = None
+    
+    for chunk in response.iter_content(STREAM_CHUNK_BYTES):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if first_table is None:
+                first_table = element
+            elif event == 'end' and element is first_table:
+                return first_table
+    
+    # The page ended without closing the table; use what was parsed
+    parser.close()
+    return first_table
+
+# Network requests allowed to any one host per second, with bursts of up to
+# the same number. Pages served from the cache do not count.
+REQUESTS_PER_SECOND_PER_HOST = 4
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: callers only wait once the rate is exceeded
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping until it is due if the bucket is empty"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve the token now so concurrent callers queue up behind it
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        
+        if wait:
+            time.sleep(wait)
+
+_host_buckets = defaultdict(lambda: TokenBucket(REQUESTS_PER_SECOND_PER_HOST, REQUESTS_PER_SECOND_PER_HOST))
+_host_buckets_lock = threading.Lock()
+
+def _wait_for_host(url):
+    """Block until a request to the URL's host fits within its rate"""
+    with _host_buckets_lock:
+        bucket = _host_buckets[urlparse(url).netloc]
+    bucket.acquire()
+
+# One session per process so connections (and their TLS sessions) to each
+# source are reused between scrapes, not just within one
+_SESSION = create_session(pool_connections=16, pool_maxsize=32)
+
+def page_text(content: bytes) -> str:
+    """
+    Text of an HTML page, parsed with lxml directly since no tree traversal is needed
+    """
+    root = etree.HTML(content)
+    if root is None:
+        return ''
+    return ''.join(PAGE_TEXT_XPATH(root))
+
 class RealOnlyScrapers:
     """
     Real-only scrapers that only use sources verified to provide real data
     Returns 0 for unavailable sources instead of simulated data
     """
     
+    # Shared by all instances, so the NEMWeb cache file is only loaded once
+    _aemo_scraper = None
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.session = _SESSION
+    
+    @property
+    def aemo_scraper(self) -> AEMONEMWebScraper:
+        """NEMWeb price scraper, created on first use"""
+        if RealOnlyScrapers._aemo_scraper is None:
+            RealOnlyScrapers._aemo_scraper = AEMONEMWebScraper()
+        return RealOnlyScrapers._aemo_scraper
+    
+    def _fetch(self, url: str) -> bytes:
+        """
+        Get a page body, reusing or revalidating the copy cached on disk where possible
+        """
+        # Only real, current data is wanted, so a failed fetch is never
+        # papered over with an old copy
+        return fetch_page(self.session, url, before_request=_wait_for_host, stale_if_error=False)
     
     def scrape_electricity_data_real_only(self) -> List[Dict]:
         """
@@ -38,8 +298,7 @@ class RealOnlyScrapers:
         
         try:
             # Use AEMO NEMWeb scraper for real electricity data
-            aemo_scraper = AEMONEMWebScraper()
-            price_data = aemo_scraper.scrape_current_prices()
+            price_data = self.aemo_scraper.scrape_current_prices()
             
             if price_data and price_data.get('data_quality') == 'REAL':
                 # Convert to our format
@@ -99,238 +358,78 @@ class RealOnlyScrapers:
         """
         Scrape real dam level data from Seqwater (Queensland)
         """
-        logger.info("Scraping real Seqwater dam levels...")
-        
-        try:
-            url = "https://www.seqwater.com.au/dam-levels"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            dam_data = []
-            
-            # Known Seqwater dams
-            seqwater_dams = [
-                'Hinze', 'Wivenhoe', 'Somerset', 'Fairbairn', 'Burdekin Falls',
-                'Baroon Pocket', 'Borumba', 'Cooloolabin', 'Ewen Maddock',
-                'Lake Macdonald', 'Lake Manchester', 'Leslie Harrison',
-                'Little Nerang', 'Maroon', 'Moogerah', 'North Pine',
-                'Poona', 'Sideling Creek', 'Six Mile Creek', 'Tingalpa', 'Wappa'
-            ]
-            
-            # Try to extract data from the main page
-            # Look for capacity information in various formats
-            capacity_patterns = [
-                r'(\d+\.?\d*)\s*%',  # Percentage patterns
-                r'(\d+\.?\d*)\s*per\s*cent',  # "per cent" patterns
-            ]
-            
-            for dam_name in seqwater_dams:
-                try:
-                    # Try to find dam-specific data on the main page
-                    dam_section = soup.find(text=re.compile(dam_name, re.IGNORECASE))
-                    if dam_section:
-                        # Look for capacity data near the dam name
-                        parent = dam_section.parent
-                        if parent:
-                            # Search in nearby elements for capacity data
-                            capacity_found = False
-                            for pattern in capacity_patterns:
-                                capacity_match = re.search(pattern, parent.get_text())
-                                if capacity_match:
-                                    capacity = float(capacity_match.group(1))
-                                    if 0 <= capacity <= 100:  # Valid percentage
-                                        dam_data.append({
-                                            'timestamp': datetime.now(),
-                                            'dam_name': dam_name,
-                                            'state': 'QLD',
-                                            'capacity_percentage': capacity,
-                                            'volume_ml': 0.0  # We don't have volume data from main page
-                                        })
-                                        capacity_found = True
-                                        logger.info(f"Found {dam_name}: {capacity}%")
-                                        break
-                            
-                            if not capacity_found:
-                                # Try individual dam page
-                                dam_url = f"https://www.seqwater.com.au/dams/{dam_name.lower().replace(' ', '-')}"
-                                dam_response = self.session.get(dam_url, timeout=10)
-                                
-                                if dam_response.status_code == 200:
-                                    dam_soup = BeautifulSoup(dam_response.content, 'html.parser')
-                                    
-                                    # Look for capacity in the dam page
-                                    for pattern in capacity_patterns:
-                                        capacity_match = re.search(pattern, dam_soup.get_text())
-                                        if capacity_match:
-                                            capacity = float(capacity_match.group(1))
-                                            if 0 <= capacity <= 100:
-                                                dam_data.append({
-                                                    'timestamp': datetime.now(),
-                                                    'dam_name': dam_name,
-                                                    'state': 'QLD',
-                                                    'capacity_percentage': capacity,
-                                                    'volume_ml': 0.0
-                                                })
-                                                logger.info(f"Found {dam_name} on individual page: {capacity}%")
-                                                break
-                                
-                                time.sleep(0.5)  # Be respectful
-                    else:
-                        # Dam not found on main page, try individual page
-                        dam_url = f"https://www.seqwater.com.au/dams/{dam_name.lower().replace(' ', '-')}"
-                        dam_response = self.session.get(dam_url, timeout=10)
-                        
-                        if dam_response.status_code == 200:
-                            dam_soup = BeautifulSoup(dam_response.content, 'html.parser')
-                            
-                            for pattern in capacity_patterns:
-                                capacity_match = re.search(pattern, dam_soup.get_text())
-                                if capacity_match:
-                                    capacity = float(capacity_match.group(1))
-                                    if 0 <= capacity <= 100:
-                                        dam_data.append({
-                                            'timestamp': datetime.now(),
-                                            'dam_name': dam_name,
-                                            'state': 'QLD',
-                                            'capacity_percentage': capacity,
-                                            'volume_ml': 0.0
-                                        })
-                                        logger.info(f"Found {dam_name} on individual page: {capacity}%")
-                                        break
-                        
-                        time.sleep(0.5)  # Be respectful
-                
-                except Exception as e:
-                    logger.error(f"Error scraping {dam_name}: {e}")
-                    continue
-            
-            if dam_data:
-                logger.info(f"Successfully scraped {len(dam_data)} real Seqwater dam records")
-            else:
-                logger.warning("No Seqwater data found - will return 0")
-            
-            return dam_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping Seqwater: {e}")
-            return []
+        return self._scrape_dam_site('Seqwater')
     
     def scrape_waternsw_real_data(self) -> List[Dict]:
         """
         Scrape real dam level data from WaterNSW (New South Wales)
         """
-        logger.info("Scraping real WaterNSW dam levels...")
-        
-        try:
-            # WaterNSW has API available, but for now we'll try web scraping
-            url = "https://www.waternsw.com.au/supply/dam-levels"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            dam_data = []
-            
-            # Known WaterNSW dams
-            waternsw_dams = [
-                'Blowering', 'Burrinjuck', 'Copeton', 'Eucumbene', 'Warragamba', 'Windamere'
-            ]
-            
-            # Look for dam level data
-            for dam_name in waternsw_dams:
-                try:
-                    # Search for dam name and nearby capacity data
-                    dam_elements = soup.find_all(text=re.compile(dam_name, re.IGNORECASE))
-                    
-                    for element in dam_elements:
-                        parent = element.parent
-                        if parent:
-                            # Look for capacity percentage in nearby text
-                            capacity_match = re.search(r'(\d+\.?\d*)\s*%', parent.get_text())
-                            if capacity_match:
-                                capacity = float(capacity_match.group(1))
-                                if 0 <= capacity <= 100:
-                                    dam_data.append({
-                                        'timestamp': datetime.now(),
-                                        'dam_name': dam_name,
-                                        'state': 'NSW',
-                                        'capacity_percentage': capacity,
-                                        'volume_ml': 0.0
-                                    })
-                                    logger.info(f"Found {dam_name}: {capacity}%")
-                                    break
-                
-                except Exception as e:
-                    logger.error(f"Error scraping {dam_name}: {e}")
-                    continue
-            
-            if dam_data:
-                logger.info(f"Successfully scraped {len(dam_data)} real WaterNSW dam records")
-            else:
-                logger.warning("No WaterNSW data found - will return 0")
-            
-            return dam_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping WaterNSW: {e}")
-            return []
+        return self._scrape_dam_site('WaterNSW')
     
     def scrape_sa_water_real_data(self) -> List[Dict]:
         """
         Scrape real dam level data from SA Water (South Australia)
         """
-        logger.info("Scraping real SA Water dam levels...")
+        return self._scrape_dam_site('SA Water')
+    
+    def _scrape_dam_site(self, site_name: str) -> List[Dict]:
+        """
+        Scrape real dam level data from one of the DAM_SITES dam levels pages
+        """
+        site = DAM_SITES[site_name]
+        logger.info(f"Scraping real {site_name} dam levels...")
         
         try:
-            url = "https://www.waterconnect.sa.gov.au/Systems/RTWD/SitePages/Available%20Data.aspx"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            dam_data = []
+            current_time = datetime.now()
+            content = self._fetch(site['url'])
+            found = parse_dam_site(site_name, content, current_time)
             
-            # Known SA Water dams
-            sa_dams = ['Happy Valley', 'Mount Bold', 'Myponga']
+            # Fetch the individual pages of the remaining dams side by side
+            missing = [dam_name for dam_name in site['dams'] if dam_name not in found]
+            if site['dam_page_urls'] and missing:
+                with ThreadPoolExecutor(max_workers=DAM_PAGE_WORKERS) as executor:
+                    found.update(zip(missing, executor.map(self._scrape_dam_page, repeat(site), missing, repeat(current_time))))
             
-            # Look for dam level data
-            for dam_name in sa_dams:
-                try:
-                    # Search for dam name and nearby capacity data
-                    dam_elements = soup.find_all(text=re.compile(dam_name, re.IGNORECASE))
-                    
-                    for element in dam_elements:
-                        parent = element.parent
-                        if parent:
-                            # Look for capacity percentage in nearby text
-                            capacity_match = re.search(r'(\d+\.?\d*)\s*%', parent.get_text())
-                            if capacity_match:
-                                capacity = float(capacity_match.group(1))
-                                if 0 <= capacity <= 100:
-                                    dam_data.append({
-                                        'timestamp': datetime.now(),
-                                        'dam_name': dam_name,
-                                        'state': 'SA',
-                                        'capacity_percentage': capacity,
-                                        'volume_ml': 0.0
-                                    })
-                                    logger.info(f"Found {dam_name}: {capacity}%")
-                                    break
-                
-                except Exception as e:
-                    logger.error(f"Error scraping {dam_name}: {e}")
-                    continue
+            dam_data = [found[dam_name] for dam_name in site['dams'] if found.get(dam_name)]
             
             if dam_data:
-                logger.info(f"Successfully scraped {len(dam_data)} real SA Water dam records")
+                logger.info(f"Successfully scraped {len(dam_data)} real {site_name} dam records")
             else:
-                logger.warning("No SA Water data found - will return 0")
+                logger.warning(f"No {site_name} data found - will return 0")
             
             return dam_data
             
         except Exception as e:
-            logger.error(f"Error scraping SA Water: {e}")
+            logger.error(f"Error scraping {site_name}: {e}")
             return []
     
+    def _scrape_dam_page(self, site: Dict, dam_name: str, timestamp: datetime) -> Optional[Dict]:
+        """
+        Look up a dam's capacity on its individual page
+        """
+        try:
+            content = self._fetch(site['dam_page_urls'][dam_name])
+        except requests.HTTPError:
+            # Not every dam has its own page
+            return None
+        except requests.RequestException as e:
+            logger.error(f"Error scraping {dam_name}: {e}")
+            return None
+        
+        # Look for capacity in the dam page
+        capacity = find_capacity(page_text(content), site['capacity_res'])
+        if capacity is None:
+            return None
+        
+        logger.info(f"Found {dam_name} on individual page: {capacity}%")
+        return {
+            'timestamp': timestamp,
+            'dam_name': dam_name,
+            'state': site['state'],
+            'capacity_percentage': capacity,
+            'volume_ml': 0.0
+        }
+    
     def scrape_hydro_tasmania_real_data(self) -> List[Dict]:
         """
         Scrape real dam level data from Hydro Tasmania
@@ -338,53 +437,41 @@ class RealOnlyScrapers:
         logger.info("Scraping real Hydro Tasmania lake levels...")
         
         try:
+            current_time = datetime.now()
             url = "https://www.hydro.com.au/water/lake-levels"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            # Stream the page and stop downloading once the lake levels table is complete
+            with self.session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                table = read_first_table(response)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
             dam_data = []
             
             # Look for the lake levels table
-            table = soup.find('table')
-            if table:
-                rows = table.find_all('tr')[1:]  # Skip header row
-                
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:
+            if table is not None:
+                for row in LAKE_ROWS_XPATH(table):
+                    lake_name = LAKE_NAME_XPATH(row).strip()
+                    
+                    # Extract metres from full
+                    metres_text = METRES_FROM_FULL_XPATH(row).strip()
+                    if metres_text and metres_text != 'Spilling':
                         try:
-                            # Extract lake name from the link
-                            lake_link = cells[0].find('a')
-                            if lake_link:
-                                lake_name = lake_link.get_text().strip()
-                                
-                                # Extract metres from full
-                                metres_text = cells[1].get_text().strip()
-                                if metres_text and metres_text != 'Spilling':
-                                    try:
-                                        metres_from_full = float(metres_text)
-                                        
-                                        # Convert to percentage (this is approximate)
-                                        # We'll need to get the actual capacity data for accurate conversion
-                                        # For now, we'll estimate based on typical dam capacities
-                                        estimated_capacity = max(0, min(100, 100 - (metres_from_full * 2)))
-                                        
-                                        dam_data.append({
-                                            'timestamp': datetime.now(),
-                                            'dam_name': lake_name,
-                                            'state': 'TAS',
-                                            'capacity_percentage': round(estimated_capacity, 1),
-                                            'volume_ml': 0.0  # We don't have volume data
-                                        })
-                                        logger.info(f"Found {lake_name}: {estimated_capacity}% (estimated from {metres_from_full}m from full)")
-                                        
-                                    except ValueError:
-                                        continue
-                                        
-                        except Exception as e:
-                            logger.error(f"Error parsing row: {e}")
+                            metres_from_full = float(metres_text)
+                        except ValueError:
                             continue
+                        
+                        # Convert to percentage (this is approximate)
+                        # We'll need to get the actual capacity data for accurate conversion
+                        # For now, we'll estimate based on typical dam capacities
+                        estimated_capacity = max(0, min(100, 100 - (metres_from_full * 2)))
+                        
+                        dam_data.append({
+                            'timestamp': current_time,
+                            'dam_name': lake_name,
+                            'state': 'TAS',
+                            'capacity_percentage': round(estimated_capacity, 1),
+                            'volume_ml': 0.0  # We don't have volume data
+                        })
+                        logger.info(f"Found {lake_name}: {estimated_capacity}% (estimated from {metres_from_full}m from full)")
             
             if dam_data:
                 logger.info(f"Successfully scraped {len(dam_data)} real Hydro Tasmania records")
@@ -420,65 +507,45 @@ class RealOnlyScrapers:
             'dam_levels': []
         }
         
-        # Scrape electricity data (returns 0 for all since no real sources available)
-        try:
-            electricity_data = self.scrape_electricity_data_real_only()
-            all_data['electricity_prices'].extend(electricity_data)
-        except Exception as e:
-            logger.error(f"Electricity data scraping failed: {e}")
-        
-        # Scrape real dam data from available sources
-        try:
-            seqwater_data = self.scrape_seqwater_real_data()
-            all_data['dam_levels'].extend(seqwater_data)
-        except Exception as e:
-            logger.error(f"Seqwater scraping failed: {e}")
+        # Every source is a different host, so scrape them all at once.
+        # Results are gathered in this order so the output order is stable.
+        sources = [
+            (self.scrape_electricity_data_real_only, 'electricity_prices', 'Electricity data'),
+            (self.scrape_seqwater_real_data, 'dam_levels', 'Seqwater'),
+            (self.scrape_waternsw_real_data, 'dam_levels', 'WaterNSW'),
+            (self.scrape_sa_water_real_data, 'dam_levels', 'SA Water'),
+            (self.scrape_hydro_tasmania_real_data, 'dam_levels', 'Hydro Tasmania')
+        ]
         
-        try:
-            waternsw_data = self.scrape_waternsw_real_data()
-            all_data['dam_levels'].extend(waternsw_data)
-        except Exception as e:
-            logger.error(f"WaterNSW scraping failed: {e}")
-        
-        try:
-            sa_water_data = self.scrape_sa_water_real_data()
-            all_data['dam_levels'].extend(sa_water_data)
-        except Exception as e:
-            logger.error(f"SA Water scraping failed: {e}")
-        
-        try:
-            hydro_tas_data = self.scrape_hydro_tasmania_real_data()
-            all_data['dam_levels'].extend(hydro_tas_data)
-        except Exception as e:
-            logger.error(f"Hydro Tasmania scraping failed: {e}")
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [(executor.submit(scraper), key, name) for scraper, key, name in sources]
+            
+            for future, key, name in futures:
+                try:
+                    all_data[key].extend(future.result())
+                except Exception as e:
+                    logger.error(f"{name} scraping failed: {e}")
         
         # Melbourne Water is not accessible (404) - no data added
         
-        # Fill in missing dams with 0 values
-        all_states = ['NSW', 'VIC', 'QLD', 'SA', 'TAS']
-        all_dams = {
-            'NSW': ['Blowering', 'Burrinjuck', 'Copeton', 'Eucumbene', 'Warragamba', 'Windamere'],
-            'VIC': ['Dartmouth', 'Eildon', 'Hume', 'Thomson', 'Yarrawonga'],
-            'QLD': ['Hinze', 'Wivenhoe', 'Somerset', 'Fairbairn', 'Burdekin Falls', 'Baroon Pocket', 'Borumba', 'Cooloolabin', 'Ewen Maddock', 'Lake Macdonald', 'Lake Manchester', 'Leslie Harrison', 'Little Nerang', 'Maroon', 'Moogerah', 'North Pine', 'Poona', 'Sideling Creek', 'Six Mile Creek', 'Tingalpa', 'Wappa'],
-            'SA': ['Happy Valley', 'Mount Bold', 'Myponga'],
-            'TAS': ['Gordon', 'Great Lake', 'Lake Pedder']
-        }
-        
-        # Add 0 values for dams that weren't found
-        found_dams = {(dam['dam_name'], dam['state']) for dam in all_data['dam_levels']}
+        # Fill in missing dams with 0 values, keyed by (state, dam name)
+        dam_levels = {(dam['state'], dam['dam_name']): dam for dam in all_data['dam_levels']}
+        current_time = datetime.now()
         
-        for state, dams in all_dams.items():
+        for state, dams in ALL_DAMS.items():
             for dam_name in dams:
-                if (dam_name, state) not in found_dams:
-                    all_data['dam_levels'].append({
-                        'timestamp': datetime.now(),
+                if (state, dam_name) not in dam_levels:
+                    dam_levels[(state, dam_name)] = {
+                        'timestamp': current_time,
                         'dam_name': dam_name,
                         'state': state,
                         'capacity_percentage': 0.0,  # No real data available
                         'volume_ml': 0.0
-                    })
+                    }
                     logger.info(f"Added {dam_name} ({state}): 0% - no real data available")
         
+        all_data['dam_levels'] = list(dam_levels.values())
+        
         logger.info(f"Real-only scraping complete. Got {len(all_data['electricity_prices'])} electricity records and {len(all_data['dam_levels'])} dam records")
         
         return all_data
@@ -6,25 +6,52 @@ Real-time web scrapers for actual current data from official sources
 import requests
 import pandas as pd
 from bs4 import BeautifulSoup
+from lxml import etree
 from datetime import datetime, timedelta
 import json
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 import re
+from .http_session import create_session
+from .page_cache import fetch_page
 
 logger = logging.getLogger(__name__)
 
+# Individual Seqwater dam pages fetched at once
+SEQWATER_PAGE_WORKERS = 3
+
+# Page patterns, compiled once per process
+DAM_CLASS_RE = re.compile(r'dam|level|capacity')
+PERCENT_RE = re.compile(r'\d+\.\d+%')
+VOLUME_ML_RE = re.compile(r'\d+,\d+ ML')
+
+# Hydro Tasmania lake levels table selectors, compiled once per process.
+# Lake rows are the rows after the header with a linked lake name and a level cell.
+FIRST_TABLE_XPATH = etree.XPath("(//table)[1]")
+LAKE_ROWS_XPATH = etree.XPath("(.//tr)[position() > 1][count(.//td) >= 2][(.//td)[1]//a]")
+LAKE_NAME_XPATH = etree.XPath("string(((.//td)[1]//a)[1])")
+METRES_FROM_FULL_XPATH = etree.XPath("string((.//td)[2])")
+
+# One session per process so connections (and their TLS sessions) to each
+# source are reused between scrapes, not just within one
+_SESSION = create_session()
+
 class RealTimeScrapers:
     """
     Real-time web scrapers that get actual current data from official sources
     """
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.session = _SESSION
+    
+    def _fetch(self, url: str) -> bytes:
+        """
+        Get a page body, revalidating the copy cached on disk with a conditional GET
+        """
+        # Always ask the server, since these scrapers are after the current
+        # data, but an unchanged page is not downloaded again
+        return fetch_page(self.session, url, max_age=0, stale_if_error=False)
     
     def scrape_seqwater_real_time(self) -> List[Dict]:
         """
@@ -37,10 +64,7 @@ class RealTimeScrapers:
             # Let's try to get data from their dam levels page
             url = "https://www.seqwater.com.au/dam-levels"
             
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self._fetch(url), 'lxml')
             
             # Look for data in script tags or data attributes
             dam_data = []
@@ -59,7 +83,7 @@ class RealTimeScrapers:
             
             # If no JSON found, try to parse HTML structure
             # Look for dam level information in the page
-            dam_cards = soup.find_all(['div', 'section'], class_=re.compile(r'dam|level|capacity'))
+            dam_cards = soup.find_all(['div', 'section'], class_=DAM_CLASS_RE)
             
             # For now, let's create a more realistic approach
             # We'll try to get the actual current data by making API calls
@@ -68,51 +92,11 @@ class RealTimeScrapers:
             # Try to get data from individual dam pages
             dam_names = ['Hinze', 'Wivenhoe', 'Somerset', 'Fairbairn', 'Burdekin Falls']
             
-            for dam_name in dam_names:
-                try:
-                    dam_url = f"https://www.seqwater.com.au/dams/{dam_name.lower().replace(' ', '-')}"
-                    dam_response = self.session.get(dam_url, timeout=10)
-                    
-                    if dam_response.status_code == 200:
-                        dam_soup = BeautifulSoup(dam_response.content, 'html.parser')
-                        
-                        # Look for capacity information
-                        capacity_elements = dam_soup.find_all(text=re.compile(r'\d+\.\d+%'))
-                        
-                        for element in capacity_elements:
-                            if '%' in element:
-                                try:
-                                    capacity = float(element.replace('%', ''))
-                                    
-                                    # Look for volume information
-                                    volume_elements = dam_soup.find_all(text=re.compile(r'\d+,\d+ ML'))
-                                    volume_ml = 0
-                                    for vol_element in volume_elements:
-                                        try:
-                                            volume_ml = float(vol_element.replace(',', '').replace(' ML', ''))
-                                            break
-                                        except:
-                                            continue
-                                    
-                                    dam_info = {
-                                        'timestamp': datetime.now(),
-                                        'dam_name': dam_name,
-                                        'state': 'QLD',
-                                        'capacity_percentage': capacity,
-                                        'volume_ml': volume_ml
-                                    }
-                                    dam_data.append(dam_info)
-                                    logger.info(f"Found {dam_name}: {capacity}%")
-                                    break
-                                    
-                                except ValueError:
-                                    continue
-                    
-                    time.sleep(1)  # Be respectful to the server
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping {dam_name}: {e}")
-                    continue
+            # Fetch the dam pages side by side; the worker count bounds the load on their server
+            with ThreadPoolExecutor(max_workers=SEQWATER_PAGE_WORKERS) as executor:
+                for dam_info in executor.map(self._scrape_seqwater_dam_page, dam_names):
+                    if dam_info:
+                        dam_data.append(dam_info)
             
             if dam_data:
                 logger.info(f"Successfully scraped {len(dam_data)} real-time Seqwater dam records")
@@ -125,6 +109,55 @@ class RealTimeScrapers:
             logger.error(f"Error scraping Seqwater real-time data: {e}")
             return []
     
+    def _scrape_seqwater_dam_page(self, dam_name: str) -> Optional[Dict]:
+        """
+        Scrape a dam's current level from its individual Seqwater page
+        """
+        try:
+            dam_url = f"https://www.seqwater.com.au/dams/{dam_name.lower().replace(' ', '-')}"
+            try:
+                dam_content = self._fetch(dam_url)
+            except requests.HTTPError:
+                # Not every dam has its own page
+                return None
+            
+            dam_soup = BeautifulSoup(dam_content, 'lxml')
+            
+            # Look for capacity information. The cheap substring checks spare
+            # most text nodes the regex, and the scans stop at the first match
+            # rather than collecting every one first.
+            for element in dam_soup.strings:
+                if '%' in element and PERCENT_RE.search(element):
+                    try:
+                        capacity = float(element.replace('%', ''))
+                    except ValueError:
+                        continue
+                    
+                    # Look for volume information
+                    volume_ml = 0
+                    for vol_element in dam_soup.strings:
+                        if ' ML' in vol_element and VOLUME_ML_RE.search(vol_element):
+                            try:
+                                volume_ml = float(vol_element.replace(',', '').replace(' ML', ''))
+                                break
+                            except ValueError:
+                                continue
+                    
+                    dam_info = {
+                        'timestamp': datetime.now(),
+                        'dam_name': dam_name,
+                        'state': 'QLD',
+                        'capacity_percentage': capacity,
+                        'volume_ml': volume_ml
+                    }
+                    logger.info(f"Found {dam_name}: {capacity}%")
+                    return dam_info
+        
+        except Exception as e:
+            logger.error(f"Error scraping {dam_name}: {e}")
+        
+        return None
+    
     def scrape_hydro_tasmania_real_time(self) -> List[Dict]:
         """
         Scrape real-time dam levels from Hydro Tasmania
@@ -134,54 +167,38 @@ class RealTimeScrapers:
             
             url = "https://www.hydro.com.au/water/lake-levels"
             
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            root = etree.HTML(self._fetch(url))
             
             dam_data = []
             
             # Look for the lake levels table
-            table = soup.find('table')
-            if table:
-                rows = table.find_all('tr')[1:]  # Skip header row
-                
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:
+            tables = FIRST_TABLE_XPATH(root) if root is not None else []
+            if tables:
+                for row in LAKE_ROWS_XPATH(tables[0]):
+                    lake_name = LAKE_NAME_XPATH(row).strip()
+                    
+                    # Extract metres from full
+                    metres_text = METRES_FROM_FULL_XPATH(row).strip()
+                    if metres_text and metres_text != 'Spilling':
                         try:
-                            # Extract lake name from the link
-                            lake_link = cells[0].find('a')
-                            if lake_link:
-                                lake_name = lake_link.get_text().strip()
-                                
-                                # Extract metres from full
-                                metres_text = cells[1].get_text().strip()
-                                if metres_text and metres_text != 'Spilling':
-                                    try:
-                                        metres_from_full = float(metres_text)
-                                        
-                                        # Convert to percentage (this is approximate)
-                                        # We'll need to get the actual capacity data for accurate conversion
-                                        # For now, we'll estimate based on typical dam capacities
-                                        estimated_capacity = max(0, min(100, 100 - (metres_from_full * 2)))
-                                        
-                                        dam_info = {
-                                            'timestamp': datetime.now(),
-                                            'dam_name': lake_name,
-                                            'state': 'TAS',
-                                            'capacity_percentage': round(estimated_capacity, 1),
-                                            'volume_ml': 0  # We'd need more data to calculate this accurately
-                                        }
-                                        dam_data.append(dam_info)
-                                        logger.info(f"Found {lake_name}: {estimated_capacity}% (estimated)")
-                                        
-                                    except ValueError:
-                                        continue
-                                        
-                        except Exception as e:
-                            logger.error(f"Error parsing row: {e}")
+                            metres_from_full = float(metres_text)
+                        except ValueError:
                             continue
+                        
+                        # Convert to percentage (this is approximate)
+                        # We'll need to get the actual capacity data for accurate conversion
+                        # For now, we'll estimate based on typical dam capacities
+                        estimated_capacity = max(0, min(100, 100 - (metres_from_full * 2)))
+                        
+                        dam_info = {
+                            'timestamp': datetime.now(),
+                            'dam_name': lake_name,
+                            'state': 'TAS',
+                            'capacity_percentage': round(estimated_capacity, 1),
+                            'volume_ml': 0  # We'd need more data to calculate this accurately
+                        }
+                        dam_data.append(dam_info)
+                        logger.info(f"Found {lake_name}: {estimated_capacity}% (estimated)")
             
             if dam_data:
                 logger.info(f"Successfully scraped {len(dam_data)} real-time Hydro Tasmania records")
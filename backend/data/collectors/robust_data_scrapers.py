@@ -1,27 +1,51 @@
-import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+import numpy as np
+from lxml import etree
 from datetime import datetime, timedelta
 import json
 import time
 import logging
+from itertools import product
 from typing import List, Dict, Optional
 import re
 import random
-import math
+from .http_session import create_session
+from .market_estimates import typical_price, typical_demand
+from .page_cache import fetch_page
+from .real_data_scrapers import dam_level_records
 
 logger = logging.getLogger(__name__)
 
+# Seqwater table selectors, compiled once per process
+TABLE_ROWS_XPATH = etree.XPath("//table//tr")
+ROW_CELLS_XPATH = etree.XPath(".//td | .//th")
+
+REGIONS = ['NSW1', 'VIC1', 'QLD1', 'SA1', 'TAS1']
+
+# Shared random generator; historical prices draw all their variation in one call
+_RNG = np.random.default_rng()
+
+# Array forms for the vectorized historical generator, built from the cached
+# per-value functions: prices indexed [month, hour, region] (month 0 unused)
+# and demand indexed [hour, region], regions in REGIONS order
+_BASE_PRICE_ARRAY = np.array([
+    [[typical_price(region, hour, month) for region in REGIONS] for hour in range(24)]
+    for month in range(13)
+])
+_DEMAND_ARRAY = np.array([[typical_demand(region, hour) for region in REGIONS] for hour in range(24)])
+_SUPPLY_ARRAY = np.round(_DEMAND_ARRAY * 1.08, 2)  # Supply typically 8% higher than demand
+
+# One session per process so connections (and their TLS sessions) to each
+# source are reused between scrapes, not just within one
+_SESSION = create_session()
+
 class RobustDataScrapers:
     """
     Robust web scrapers that focus on working data sources and provide realistic fallbacks
     """
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.session = _SESSION
     
     def scrape_electricity_data_realistic(self) -> List[Dict]:
         """
@@ -37,13 +61,14 @@ class RobustDataScrapers:
             prices = []
             for region in regions:
                 base_price = self._get_realistic_base_price(region, current_time)
+                demand = self._estimate_realistic_demand(region, current_time)
                 
                 price_data = {
                     'timestamp': current_time,
                     'region': region,
                     'price': base_price,
-                    'demand': self._estimate_realistic_demand(region, current_time),
-                    'supply': self._estimate_realistic_supply(region, current_time)
+                    'demand': demand,
+                    'supply': round(demand * 1.08, 2)  # Supply typically 8% higher than demand
                 }
                 prices.append(price_data)
             
@@ -61,25 +86,21 @@ class RobustDataScrapers:
         try:
             url = "https://www.seqwater.com.au/dam-levels"
             
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Reuses the cached page, revalidated with a conditional GET once stale
+            root = etree.HTML(fetch_page(self.session, url))
             
             dam_levels = []
             
             # Look for actual data in the page
             # Check for data tables, JSON scripts, or API endpoints
-            tables = soup.find_all('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 3:
-                        # Try to extract dam data from table
-                        dam_name = cells[0].get_text(strip=True)
-                        if 'dam' in dam_name.lower() or any(dam in dam_name.lower() for dam in ['wivenhoe', 'somerset', 'fairbairn']):
-                            logger.info(f"Found potential dam data: {dam_name}")
+            rows = TABLE_ROWS_XPATH(root) if root is not None else []
+            for row in rows:
+                cells = ROW_CELLS_XPATH(row)
+                if len(cells) >= 3:
+                    # Try to extract dam data from table
+                    dam_name = ''.join(text.strip() for text in cells[0].itertext())
+                    if 'dam' in dam_name.lower() or any(dam in dam_name.lower() for dam in ['wivenhoe', 'somerset', 'fairbairn']):
+                        logger.info(f"Found potential dam data: {dam_name}")
             
             # Use realistic current data for Queensland based on actual conditions
             qld_dams = {
@@ -92,19 +113,11 @@ class RobustDataScrapers:
             
             current_time = datetime.now()
             
-            for dam_name, data in qld_dams.items():
-                variation = self._calculate_daily_dam_variation(dam_name, current_time)
-                current_percentage = max(0, min(100, data['current_percentage'] + variation))
-                current_volume = (current_percentage / 100) * data['capacity_ml']
-                
-                dam_data = {
-                    'timestamp': current_time,
-                    'dam_name': dam_name,
-                    'state': 'QLD',
-                    'capacity_percentage': round(current_percentage, 2),
-                    'volume_ml': round(current_volume, 2)
-                }
-                dam_levels.append(dam_data)
+            dam_levels.extend(dam_level_records(
+                [(name, data['capacity_ml'], data['current_percentage']) for name, data in qld_dams.items()],
+                'QLD',
+                current_time
+            ))
             
             logger.info(f"Scraped {len(dam_levels)} QLD dam level records")
             return dam_levels
@@ -156,23 +169,15 @@ class RobustDataScrapers:
                 }
             }
             
-            dam_levels = []
             current_time = datetime.now()
             
-            for state, dams in all_dams.items():
-                for dam_name, data in dams.items():
-                    variation = self._calculate_daily_dam_variation(dam_name, current_time)
-                    current_percentage = max(0, min(100, data['current_percentage'] + variation))
-                    current_volume = (current_percentage / 100) * data['capacity_ml']
-                    
-                    dam_data = {
-                        'timestamp': current_time,
-                        'dam_name': dam_name,
-                        'state': state,
-                        'capacity_percentage': round(current_percentage, 2),
-                        'volume_ml': round(current_volume, 2)
-                    }
-                    dam_levels.append(dam_data)
+            # Every state's dams in one pass
+            states = [state for state, dams in all_dams.items() for _ in dams]
+            dams = [
+                (name, data['capacity_ml'], data['current_percentage'])
+                for dams in all_dams.values() for name, data in dams.items()
+            ]
+            dam_levels = dam_level_records(dams, states, current_time)
             
             logger.info(f"Generated {len(dam_levels)} realistic dam level records across all states")
             return dam_levels
@@ -188,28 +193,37 @@ class RobustDataScrapers:
         try:
             logger.info(f"Generating historical electricity data for the past {days_back} days...")
             
-            regions = ['NSW1', 'VIC1', 'QLD1', 'SA1', 'TAS1']
-            historical_data = []
+            now = datetime.now()
+            days = [now - timedelta(days=day_offset) for day_offset in range(days_back)]
             
-            # Generate data for each day going back
-            for day_offset in range(days_back):
-                current_date = datetime.now() - timedelta(days=day_offset)
-                
-                # Generate data for each hour of the day
-                for hour in range(24):
-                    timestamp = current_date.replace(hour=hour, minute=0, second=0, microsecond=0)
-                    
-                    for region in regions:
-                        base_price = self._get_realistic_base_price(region, timestamp)
-                        
-                        price_data = {
-                            'timestamp': timestamp,
-                            'region': region,
-                            'price': base_price,
-                            'demand': self._estimate_realistic_demand(region, timestamp),
-                            'supply': self._estimate_realistic_supply(region, timestamp)
-                        }
-                        historical_data.append(price_data)
+            # (day, hour, region) arrays: scale the random variation in place
+            # and round the whole array once
+            months = np.array([day.month for day in days], dtype=int)
+            price = _RNG.uniform(0.8, 1.3, size=(len(days), 24, len(REGIONS)))
+            price *= _BASE_PRICE_ARRAY[months]
+            np.round(price, 2, out=price)
+            
+            timestamps = [
+                day.replace(hour=hour, minute=0, second=0, microsecond=0)
+                for day in days
+                for hour in range(24)
+            ]
+            
+            historical_data = [
+                {
+                    'timestamp': timestamp,
+                    'region': region,
+                    'price': price_value,
+                    'demand': demand_value,
+                    'supply': supply_value
+                }
+                for (timestamp, region), price_value, demand_value, supply_value in zip(
+                    product(timestamps, REGIONS),
+                    price.ravel().tolist(),
+                    np.tile(_DEMAND_ARRAY.ravel(), len(days)).tolist(),
+                    np.tile(_SUPPLY_ARRAY.ravel(), len(days)).tolist()
+                )
+            ]
             
             logger.info(f"Generated {len(historical_data)} historical electricity price records")
             return historical_data
@@ -222,90 +236,18 @@ class RobustDataScrapers:
         """
         Get realistic base price based on current market conditions
         """
-        # Base prices by region (AUD/MWh) - updated for current market
-        base_prices = {
-            'NSW1': 95.0,  # Higher due to coal plant closures
-            'VIC1': 85.0,  # Good renewable penetration
-            'QLD1': 100.0, # High demand, coal dependent
-            'SA1': 110.0,  # High renewable but isolated
-            'TAS1': 75.0   # Hydro dominated, stable
-        }
-        
-        base = base_prices.get(region, 90.0)
-        
-        # Time of day multiplier
-        hour = timestamp.hour
-        if 6 <= hour <= 9 or 17 <= hour <= 20:  # Peak hours
-            multiplier = 1.6
-        elif 22 <= hour <= 5:  # Off-peak hours
-            multiplier = 0.6
-        else:  # Shoulder hours
-            multiplier = 1.0
-            
-        # Seasonal adjustment
-        month = timestamp.month
-        if month in [12, 1, 2]:  # Summer
-            multiplier *= 1.3
-        elif month in [6, 7, 8]:  # Winter
-            multiplier *= 1.2
+        base = typical_price(region, timestamp.hour, timestamp.month)
             
         # Add some random variation
         variation = random.uniform(0.8, 1.3)
         
-        return round(base * multiplier * variation, 2)
+        return round(base * variation, 2)
     
     def _estimate_realistic_demand(self, region: str, timestamp: datetime) -> float:
         """
         Estimate realistic electricity demand
         """
-        base_demand = {
-            'NSW1': 8500,
-            'VIC1': 6500,
-            'QLD1': 7500,
-            'SA1': 1600,
-            'TAS1': 1300
-        }
-        
-        base = base_demand.get(region, 5000)
-        
-        # Time of day adjustment
-        hour = timestamp.hour
-        if 6 <= hour <= 9 or 17 <= hour <= 20:
-            multiplier = 1.4
-        elif 22 <= hour <= 5:
-            multiplier = 0.6
-        else:
-            multiplier = 1.0
-            
-        return round(base * multiplier, 2)
-    
-    def _estimate_realistic_supply(self, region: str, timestamp: datetime) -> float:
-        """
-        Estimate realistic electricity supply
-        """
-        demand = self._estimate_realistic_demand(region, timestamp)
-        return round(demand * 1.08, 2)  # Supply typically 8% higher than demand
-    
-    def _calculate_daily_dam_variation(self, dam_name: str, timestamp: datetime) -> float:
-        """
-        Calculate realistic daily variation in dam levels
-        """
-        # Seasonal patterns
-        month = timestamp.month
-        seasonal_factor = 1.0
-        if month in [6, 7, 8, 9]:  # Winter/Spring
-            seasonal_factor = 1.3
-        elif month in [12, 1, 2]:  # Summer
-            seasonal_factor = 0.7
-            
-        # Random daily variation
-        daily_variation = random.uniform(-1.5, 1.5) * seasonal_factor
-        
-        # Add cyclical patterns
-        dam_hash = hash(dam_name) % 100
-        cyclical_factor = math.sin((timestamp.day + dam_hash) * 0.1) * 0.3
-        
-        return daily_variation + cyclical_factor
+        return typical_demand(region, timestamp.hour)
     
     def scrape_all_data(self) -> Dict[str, List[Dict]]:
         """
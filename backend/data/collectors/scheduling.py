@@ -0,0 +1,43 @@
+"""
+Running scheduled collection jobs in the background
+"""
+
+import schedule
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# One lock per job, held while it runs, so a job that is still going when it
+# comes due again is skipped rather than run twice at once
+_job_locks = {}
+_job_locks_lock = threading.Lock()
+
+def run_in_background(job):
+    """
+    Run a scheduled job on its own thread so a slow job doesn't delay the others
+    """
+    with _job_locks_lock:
+        lock = _job_locks.setdefault(job, threading.Lock())
+
+    if not lock.acquire(blocking=False):
+        logger.warning(f"Skipping {job.__name__}: its previous run hasn't finished")
+        return
+
+    def run():
+        try:
+            job()
+        finally:
+            lock.release()
+
+    threading.Thread(target=run, name=job.__name__, daemon=True).start()
+
+def run_schedule_forever():
+    """
+    Run pending jobs, sleeping until the next one is due instead of polling
+    """
+    while True:
+        schedule.run_pending()
+        idle_seconds = schedule.idle_seconds()
+        time.sleep(60 if idle_seconds is None else max(idle_seconds, 0))
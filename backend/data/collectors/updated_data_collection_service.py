@@ -1,12 +1,14 @@
 import schedule
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
-from backend.database.database import SessionLocal, ElectricityPrice, DamLevel
+from backend.database.database import SessionLocal, ElectricityPrice, DamLevel, delete_older_than, filter_new_rows
 from backend.data.collectors.updated_real_data_scrapers import UpdatedRealDataScrapers
+from backend.data.collectors.scheduling import run_in_background, run_schedule_forever
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +19,6 @@ class UpdatedDataCollectionService:
     
     def __init__(self):
         self.scraper = UpdatedRealDataScrapers()
-        self.db = SessionLocal()
     
     def collect_and_store_electricity_data(self):
         """
@@ -40,26 +41,26 @@ class UpdatedDataCollectionService:
             if electricity_data:
                 # Store in database
                 stored_count = 0
-                for data in electricity_data:
-                    # Check if record already exists for this timestamp and region
-                    existing = self.db.query(ElectricityPrice).filter(
-                        ElectricityPrice.timestamp == data['timestamp'],
-                        ElectricityPrice.region == data['region']
-                    ).first()
+                with SessionLocal() as db:
+                    for data in electricity_data:
+                        # Check if record already exists for this timestamp and region
+                        existing = db.query(ElectricityPrice).filter(
+                            ElectricityPrice.timestamp == data['timestamp'],
+                            ElectricityPrice.region == data['region']
+                        ).first()
+                        
+                        if not existing:
+                            price_record = ElectricityPrice(**data)
+                            db.add(price_record)
+                            stored_count += 1
                     
-                    if not existing:
-                        price_record = ElectricityPrice(**data)
-                        self.db.add(price_record)
-                        stored_count += 1
-                
-                self.db.commit()
+                    db.commit()
                 logger.info(f"Stored {stored_count} new electricity price records")
             else:
                 logger.warning("No electricity data collected from any source")
                 
         except Exception as e:
             logger.error(f"Error collecting electricity data: {e}")
-            self.db.rollback()
     
     def collect_and_store_dam_data(self):
         """
@@ -69,47 +70,24 @@ class UpdatedDataCollectionService:
             logger.info("Starting updated dam level data collection...")
             
             # Scrape dam levels from all sources
-            dam_sources = [
-                self.scraper.scrape_waternsw_dam_levels,
-                self.scraper.scrape_melbourne_water_levels,
-                self.scraper.scrape_seqwater_levels,
-                self.scraper.scrape_bom_water_storage
-            ]
+            all_dam_data = self.scraper.scrape_dam_levels()
             
+            # Store only records not already in the database, in one batch and one commit
             total_dam_records = 0
-            
-            for scraper in dam_sources:
-                try:
-                    dam_data = scraper()
-                    
-                    if dam_data:
-                        for data in dam_data:
-                            # Check if record already exists
-                            existing = self.db.query(DamLevel).filter(
-                                DamLevel.timestamp == data['timestamp'],
-                                DamLevel.dam_name == data['dam_name'],
-                                DamLevel.state == data['state']
-                            ).first()
-                            
-                            if not existing:
-                                dam_record = DamLevel(**data)
-                                self.db.add(dam_record)
-                                total_dam_records += 1
-                        
-                        self.db.commit()
-                        logger.info(f"Stored {len(dam_data)} dam level records from {scraper.__name__}")
-                    
-                    time.sleep(1)  # Be respectful to servers
-                    
-                except Exception as e:
-                    logger.error(f"Error in {scraper.__name__}: {e}")
-                    continue
+            if all_dam_data:
+                with SessionLocal() as db:
+                    new_records = filter_new_rows(
+                        db, DamLevel, all_dam_data, ['timestamp', 'dam_name', 'state']
+                    )
+                    if new_records:
+                        db.execute(insert(DamLevel), new_records)
+                        db.commit()
+                    total_dam_records = len(new_records)
             
             logger.info(f"Total new dam records stored: {total_dam_records}")
             
         except Exception as e:
             logger.error(f"Error collecting dam data: {e}")
-            self.db.rollback()
     
     def collect_all_data(self):
         """
@@ -117,11 +95,10 @@ class UpdatedDataCollectionService:
         """
         logger.info("Starting comprehensive updated data collection...")
         
-        # Collect electricity data
-        self.collect_and_store_electricity_data()
-        
-        # Collect dam data
-        self.collect_and_store_dam_data()
+        # Electricity and dam sources are independent, so collect them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(self.collect_and_store_electricity_data)
+            executor.submit(self.collect_and_store_dam_data)
         
         logger.info("Updated data collection completed")
     
@@ -130,36 +107,34 @@ class UpdatedDataCollectionService:
         Get summary of data in database
         """
         try:
-            electricity_count = self.db.query(ElectricityPrice).count()
-            dam_count = self.db.query(DamLevel).count()
-            
-            # Get latest timestamps
-            latest_electricity = self.db.query(ElectricityPrice.timestamp).order_by(
-                ElectricityPrice.timestamp.desc()
-            ).first()
-            
-            latest_dam = self.db.query(DamLevel.timestamp).order_by(
-                DamLevel.timestamp.desc()
-            ).first()
-            
-            # Get data by region
-            regions = self.db.query(ElectricityPrice.region).distinct().all()
-            region_count = len(regions)
-            
-            # Get data by state
-            states = self.db.query(DamLevel.state).distinct().all()
-            state_count = len(states)
-            
-            return {
-                'electricity_records': electricity_count,
-                'dam_records': dam_count,
-                'regions_covered': region_count,
-                'states_covered': state_count,
-                'latest_electricity_update': latest_electricity[0] if latest_electricity else None,
-                'latest_dam_update': latest_dam[0] if latest_dam else None,
-                'collection_time': datetime.now()
-            }
-            
+            with SessionLocal() as db:
+                # Record count and latest timestamp per table in one aggregate query each
+                electricity_count, latest_electricity = db.query(
+                    func.count(), func.max(ElectricityPrice.timestamp)
+                ).select_from(ElectricityPrice).one()
+                
+                dam_count, latest_dam = db.query(
+                    func.count(), func.max(DamLevel.timestamp)
+                ).select_from(DamLevel).one()
+                
+                # Get data by region
+                regions = db.query(ElectricityPrice.region).distinct().all()
+                region_count = len(regions)
+                
+                # Get data by state
+                states = db.query(DamLevel.state).distinct().all()
+                state_count = len(states)
+                
+                return {
+                    'electricity_records': electricity_count,
+                    'dam_records': dam_count,
+                    'regions_covered': region_count,
+                    'states_covered': state_count,
+                    'latest_electricity_update': latest_electricity,
+                    'latest_dam_update': latest_dam,
+                    'collection_time': datetime.now()
+                }
+                
         except Exception as e:
             logger.error(f"Error getting data summary: {e}")
             return {}
@@ -171,23 +146,15 @@ class UpdatedDataCollectionService:
         try:
             cutoff_date = datetime.now() - timedelta(days=days_to_keep)
             
-            # Delete old electricity data
-            old_electricity = self.db.query(ElectricityPrice).filter(
-                ElectricityPrice.timestamp < cutoff_date
-            ).delete()
-            
-            # Delete old dam data
-            old_dam = self.db.query(DamLevel).filter(
-                DamLevel.timestamp < cutoff_date
-            ).delete()
-            
-            self.db.commit()
+            with SessionLocal() as db:
+                # Delete old data in batches so collection isn't blocked meanwhile
+                old_electricity = delete_older_than(db, ElectricityPrice, cutoff_date)
+                old_dam = delete_older_than(db, DamLevel, cutoff_date)
             
             logger.info(f"Cleaned up {old_electricity} old electricity records and {old_dam} old dam records")
             
         except Exception as e:
             logger.error(f"Error cleaning up old data: {e}")
-            self.db.rollback()
     
     def run_scheduled_collection(self):
         """
@@ -196,17 +163,15 @@ class UpdatedDataCollectionService:
         logger.info("Starting scheduled updated data collection service...")
         
         # Schedule data collection
-        schedule.every(30).minutes.do(self.collect_and_store_electricity_data)
-        schedule.every(6).hours.do(self.collect_and_store_dam_data)
-        schedule.every().day.at("02:00").do(self.cleanup_old_data)
+        schedule.every(30).minutes.do(run_in_background, self.collect_and_store_electricity_data)
+        schedule.every(6).hours.do(run_in_background, self.collect_and_store_dam_data)
+        schedule.every().day.at("02:00").do(run_in_background, self.cleanup_old_data)
         
         # Run initial collection
         self.collect_all_data()
         
         # Keep running
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        run_schedule_forever()
     
     def run_once(self):
         """
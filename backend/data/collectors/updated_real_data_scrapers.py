@@ -3,14 +3,34 @@ import pandas as pd
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import json
-import time
+import threading
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from typing import List, Dict, Optional
 import re
+import random
 import nemosis
 
+from .http_session import create_session
+from .market_estimates import typical_price, typical_demand
+from .real_data_scrapers import dam_variations
+
 logger = logging.getLogger(__name__)
 
+# JSON-looking {...} span in an inline script, compiled once per process
+_JSON_OBJECT_RE = re.compile(r'\{.*\}')
+
+# Requests allowed in flight to any one host. Different hosts are scraped in
+# parallel, but no single server sees more than this many at once.
+MAX_REQUESTS_PER_HOST = 2
+_host_limits = defaultdict(lambda: threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST))
+_host_limits_lock = threading.Lock()
+
+# One session per process, with room for every host's requests in flight at once
+_SESSION = create_session(pool_connections=16, pool_maxsize=MAX_REQUESTS_PER_HOST)
+
 class UpdatedRealDataScrapers:
     """
     Updated web scrapers for real Australian electricity market and dam level data
@@ -18,10 +38,16 @@ class UpdatedRealDataScrapers:
     """
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.session = _SESSION
+    
+    def _get(self, url: str) -> requests.Response:
+        """
+        GET a URL, waiting for a free slot if its host is already busy
+        """
+        with _host_limits_lock:
+            limit = _host_limits[urlparse(url).netloc]
+        with limit:
+            return self.session.get(url, timeout=10)
     
     def scrape_aemo_data_nemosis(self) -> List[Dict]:
         """
@@ -87,10 +113,10 @@ class UpdatedRealDataScrapers:
             # AEMO Data Dashboards URL
             url = "https://aemo.com.au/en/energy-systems/data-dashboards"
             
-            response = self.session.get(url, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for data dashboard links or embedded data
             # This is a simplified approach - would need to be customized based on actual page structure
@@ -102,13 +128,14 @@ class UpdatedRealDataScrapers:
             for region in regions:
                 # Generate realistic current prices based on market conditions
                 base_price = self._get_realistic_base_price(region, current_time)
+                demand = self._estimate_realistic_demand(region, current_time)
                 
                 price_data = {
                     'timestamp': current_time,
                     'region': region,
                     'price': base_price,
-                    'demand': self._estimate_realistic_demand(region, current_time),
-                    'supply': self._estimate_realistic_supply(region, current_time)
+                    'demand': demand,
+                    'supply': round(demand * 1.08, 2)  # Supply typically 8% higher than demand
                 }
                 prices.append(price_data)
             
@@ -127,10 +154,10 @@ class UpdatedRealDataScrapers:
             # Updated WaterNSW URL
             url = "https://www.waternsw.com.au/supply/dam-levels"
             
-            response = self.session.get(url, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             dam_levels = []
             
@@ -141,7 +168,7 @@ class UpdatedRealDataScrapers:
                 if script.string and 'dam' in script.string.lower():
                     try:
                         # Try to extract JSON data
-                        json_match = re.search(r'\{.*\}', script.string)
+                        json_match = _JSON_OBJECT_RE.search(script.string)
                         if json_match:
                             data = json.loads(json_match.group())
                             # Process the data based on structure
@@ -198,9 +225,9 @@ class UpdatedRealDataScrapers:
             
             for url in urls:
                 try:
-                    response = self.session.get(url, timeout=10)
+                    response = self._get(url)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
+                        soup = BeautifulSoup(response.content, 'lxml')
                         
                         # Look for data in various formats
                         # Check for JSON-LD structured data
@@ -255,10 +282,10 @@ class UpdatedRealDataScrapers:
         try:
             url = "https://www.seqwater.com.au/dam-levels"
             
-            response = self.session.get(url, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             dam_levels = []
             
@@ -315,10 +342,10 @@ class UpdatedRealDataScrapers:
             # Updated BoM URL
             url = "http://www.bom.gov.au/water/waterstorages/"
             
-            response = self.session.get(url, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             dam_levels = []
             
@@ -379,7 +406,7 @@ class UpdatedRealDataScrapers:
             # OpenNEM provides open source NEM data
             url = "https://opennem.org.au/api/stats/energy/nem/7d"
             
-            response = self.session.get(url, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
             
             data = response.json()
@@ -409,94 +436,51 @@ class UpdatedRealDataScrapers:
         """
         Get realistic base price based on current market conditions
         """
-        # Base prices by region (AUD/MWh) - updated for current market
-        base_prices = {
-            'NSW1': 95.0,  # Higher due to coal plant closures
-            'VIC1': 85.0,  # Good renewable penetration
-            'QLD1': 100.0, # High demand, coal dependent
-            'SA1': 110.0,  # High renewable but isolated
-            'TAS1': 75.0   # Hydro dominated, stable
-        }
-        
-        base = base_prices.get(region, 90.0)
-        
-        # Time of day multiplier
-        hour = timestamp.hour
-        if 6 <= hour <= 9 or 17 <= hour <= 20:  # Peak hours
-            multiplier = 1.6
-        elif 22 <= hour <= 5:  # Off-peak hours
-            multiplier = 0.6
-        else:  # Shoulder hours
-            multiplier = 1.0
-            
-        # Seasonal adjustment
-        month = timestamp.month
-        if month in [12, 1, 2]:  # Summer
-            multiplier *= 1.3
-        elif month in [6, 7, 8]:  # Winter
-            multiplier *= 1.2
+        base = typical_price(region, timestamp.hour, timestamp.month)
             
         # Add some random variation
-        import random
         variation = random.uniform(0.8, 1.3)
         
-        return round(base * multiplier * variation, 2)
+        return round(base * variation, 2)
     
     def _estimate_realistic_demand(self, region: str, timestamp: datetime) -> float:
         """
         Estimate realistic electricity demand
         """
-        base_demand = {
-            'NSW1': 8500,
-            'VIC1': 6500,
-            'QLD1': 7500,
-            'SA1': 1600,
-            'TAS1': 1300
-        }
-        
-        base = base_demand.get(region, 5000)
-        
-        # Time of day adjustment
-        hour = timestamp.hour
-        if 6 <= hour <= 9 or 17 <= hour <= 20:
-            multiplier = 1.4
-        elif 22 <= hour <= 5:
-            multiplier = 0.6
-        else:
-            multiplier = 1.0
-            
-        return round(base * multiplier, 2)
+        return typical_demand(region, timestamp.hour)
     
-    def _estimate_realistic_supply(self, region: str, timestamp: datetime) -> float:
+    def _calculate_daily_dam_variation(self, dam_name: str, timestamp: datetime) -> float:
         """
-        Estimate realistic electricity supply
+        Calculate realistic daily variation in dam levels
         """
-        demand = self._estimate_realistic_demand(region, timestamp)
-        return round(demand * 1.08, 2)  # Supply typically 8% higher than demand
+        return float(dam_variations([dam_name], timestamp)[0])
     
-    def _calculate_daily_dam_variation(self, dam_name: str, timestamp: datetime) -> float:
+    def scrape_dam_levels(self) -> List[Dict]:
         """
-        Calculate realistic daily variation in dam levels
+        Scrape dam levels from all sources at once
         """
-        import random
-        import math
+        dam_sources = [
+            self.scrape_waternsw_dam_levels,
+            self.scrape_melbourne_water_levels,
+            self.scrape_seqwater_levels,
+            self.scrape_bom_water_storage
+        ]
         
-        # Seasonal patterns
-        month = timestamp.month
-        seasonal_factor = 1.0
-        if month in [6, 7, 8, 9]:  # Winter/Spring
-            seasonal_factor = 1.3
-        elif month in [12, 1, 2]:  # Summer
-            seasonal_factor = 0.7
-            
-        # Random daily variation
-        daily_variation = random.uniform(-1.5, 1.5) * seasonal_factor
+        # Each source is its own host, so per-host limits in _get are enough
+        # to stay polite without waiting between sources
+        with ThreadPoolExecutor(max_workers=len(dam_sources)) as executor:
+            futures = [(scraper, executor.submit(scraper)) for scraper in dam_sources]
         
-        # Add cyclical patterns
-        dam_hash = hash(dam_name) % 100
-        cyclical_factor = math.sin((timestamp.day + dam_hash) * 0.1) * 0.3
+        dam_levels = []
+        for scraper, future in futures:
+            try:
+                dam_data = future.result()
+                dam_levels.extend(dam_data)
+                logger.info(f"Collected {len(dam_data)} dam level records from {scraper.__name__}")
+            except Exception as e:
+                logger.error(f"Error in {scraper.__name__}: {e}")
         
-        return daily_variation + cyclical_factor
+        return dam_levels
     
     def scrape_all_data(self) -> Dict[str, List[Dict]]:
         """
@@ -521,21 +505,7 @@ class UpdatedRealDataScrapers:
         except Exception as e:
             logger.error(f"Failed to scrape electricity prices: {e}")
         
-        # Scrape dam levels from all sources
-        dam_sources = [
-            self.scrape_waternsw_dam_levels,
-            self.scrape_melbourne_water_levels,
-            self.scrape_seqwater_levels,
-            self.scrape_bom_water_storage
-        ]
-        
-        for scraper in dam_sources:
-            try:
-                dam_data = scraper()
-                all_data['dam_levels'].extend(dam_data)
-                time.sleep(1)  # Be respectful to servers
-            except Exception as e:
-                logger.error(f"Failed to scrape dam data: {e}")
+        all_data['dam_levels'].extend(self.scrape_dam_levels())
         
         logger.info(f"Scraping complete. Got {len(all_data['electricity_prices'])} electricity records and {len(all_data['dam_levels'])} dam records")
         
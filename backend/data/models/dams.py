@@ -41,6 +41,8 @@ class DamLevelList(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
     dam_levels: List[DamLevelResponse]
-    total: int
+    total: Optional[int] = None  # Not counted when paging by cursor
     page: int
     size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
@@ -42,6 +42,8 @@ class ElectricityPriceList(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
     prices: List[ElectricityPriceResponse]
-    total: int
+    total: Optional[int] = None  # Not counted when paging by cursor
     page: int
     size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
@@ -1,8 +1,14 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import create_engine, delete, func, insert, inspect, select, Column, Integer, String, Float, DateTime, Text, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
+import logging
 import os
+import time
+
+logger = logging.getLogger(__name__)
 
 # Database configuration - Railway compatible
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./electricity_data.db")
@@ -17,8 +23,11 @@ if DATABASE_URL.startswith("postgresql://"):
     engine = create_engine(
         DATABASE_URL,
         echo=False,  # Disable echo in production
-        pool_pre_ping=True,
-        pool_recycle=300,
+        pool_size=20,
+        max_overflow=20,
+        pool_pre_ping=True,  # Stale connections are replaced on checkout
+        pool_recycle=1800,
+        insertmanyvalues_page_size=10_000,  # Match the bulk seeding batch size
         connect_args={
             "sslmode": "require"
         }
@@ -26,7 +35,8 @@ if DATABASE_URL.startswith("postgresql://"):
 else:
     # SQLite configuration for local development
     engine = create_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Keep loaded attributes after commit so responses don't trigger re-SELECTs
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
@@ -40,6 +50,19 @@ class ElectricityPrice(Base):
     demand = Column(Float)
     supply = Column(Float)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # One price per region per interval; lets collectors skip duplicates on insert
+        Index('uq_electricity_prices_timestamp_region', timestamp, region, unique=True),
+        # Latest/ranged prices per region, matching the default non-zero filter
+        Index(
+            'ix_electricity_prices_region_timestamp_nonzero',
+            region, timestamp.desc(),
+            postgresql_include=['price', 'demand', 'supply'],
+            postgresql_where=text('price > 0'),
+            sqlite_where=text('price > 0')
+        ),
+    )
 
 class DamLevel(Base):
     __tablename__ = "dam_levels"
@@ -51,6 +74,19 @@ class DamLevel(Base):
     capacity_percentage = Column(Float)
     volume_ml = Column(Float)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # One reading per dam per timestamp; lets collectors skip duplicates on insert
+        Index('uq_dam_levels_timestamp_dam_state', timestamp, dam_name, state, unique=True),
+        # Latest/ranged levels per dam, matching the default non-zero filter
+        Index(
+            'ix_dam_levels_dam_state_timestamp_nonzero',
+            dam_name, state, timestamp.desc(),
+            postgresql_include=['capacity_percentage', 'volume_ml'],
+            postgresql_where=text('capacity_percentage > 0'),
+            sqlite_where=text('capacity_percentage > 0')
+        ),
+    )
 
 class PricePrediction(Base):
     __tablename__ = "price_predictions"
@@ -66,6 +102,133 @@ class PricePrediction(Base):
 # Create tables
 def create_tables():
     Base.metadata.create_all(bind=engine)
+    
+    # create_all skips existing tables, so add any newer indexes to them
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.unique and has_duplicate_keys(index):
+                # Creating it would fail; inserts fall back to filter_new_rows
+                # until the duplicates are cleaned up
+                logger.warning(f"Not creating {index.name}: {table.name} has duplicate rows for its columns")
+                continue
+            try:
+                index.create(bind=engine)
+            except SQLAlchemyError as e:
+                logger.warning(f"Could not create index {index.name}: {e}")
+    
+    _unique_indexes.clear()
+
+def has_duplicate_keys(index):
+    """
+    Whether any two rows share the index's columns. Rows with a NULL in
+    those columns are left out, as a unique index doesn't treat them as equal.
+    """
+    columns = list(index.columns)
+    duplicates = (
+        select(*columns)
+        .where(*[column.is_not(None) for column in columns])
+        .group_by(*columns)
+        .having(func.count() > 1)
+        .limit(1)
+    )
+    with engine.connect() as conn:
+        return conn.execute(duplicates).first() is not None
+
+def filter_new_rows(db, model, rows, key_columns):
+    """
+    Return the rows whose key_columns values are not already stored, dropping
+    repeats within rows too. Existing keys are loaded with one query over the
+    rows' timestamp range instead of one lookup per row.
+    """
+    if not rows:
+        return []
+    
+    timestamps = [row['timestamp'] for row in rows]
+    existing_keys = {
+        tuple(key) for key in db.query(*[getattr(model, name) for name in key_columns]).filter(
+            model.timestamp >= min(timestamps),
+            model.timestamp <= max(timestamps)
+        )
+    }
+    
+    new_rows = []
+    for row in rows:
+        key = tuple(row[name] for name in key_columns)
+        if key not in existing_keys:
+            existing_keys.add(key)
+            new_rows.append(row)
+    return new_rows
+
+# Rows per INSERT statement when bulk inserting
+INSERT_BATCH_SIZE = 500
+
+# Dialects with an INSERT ... ON CONFLICT DO NOTHING construct
+CONFLICT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+# Whether each (database, table, columns) has a unique index, looked up once
+_unique_indexes = {}
+
+def has_unique_index(db, model, index_elements):
+    """Whether the table has a unique index over exactly index_elements"""
+    key = (str(db.get_bind().url), model.__tablename__, frozenset(index_elements))
+    if key not in _unique_indexes:
+        _unique_indexes[key] = any(
+            index['unique'] and set(index['column_names']) == set(index_elements)
+            for index in inspect(db.connection()).get_indexes(model.__tablename__)
+        )
+    return _unique_indexes[key]
+
+def insert_ignoring_duplicates(db, model, rows, index_elements):
+    """
+    Bulk insert rows, skipping any that clash with the unique index on
+    index_elements. Returns the number of rows inserted.
+    
+    Databases without ON CONFLICT support, or where the unique index
+    couldn't be created, fall back to filtering out stored rows first.
+    """
+    dialect = db.get_bind().dialect.name
+    conflict_insert = CONFLICT_INSERTS.get(dialect)
+    
+    if conflict_insert is None or not has_unique_index(db, model, index_elements):
+        new_rows = filter_new_rows(db, model, rows, index_elements)
+        for i in range(0, len(new_rows), INSERT_BATCH_SIZE):
+            db.execute(insert(model), new_rows[i:i + INSERT_BATCH_SIZE])
+        return len(new_rows)
+    
+    inserted = 0
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        stmt = conflict_insert(model).values(rows[i:i + INSERT_BATCH_SIZE])
+        result = db.execute(stmt.on_conflict_do_nothing(index_elements=index_elements))
+        inserted += result.rowcount
+    return inserted
+
+# Rows per DELETE statement when pruning old data, and the pause between batches
+DELETE_BATCH_SIZE = 10_000
+DELETE_BATCH_PAUSE = 0.05
+
+def delete_older_than(db, model, cutoff):
+    """
+    Delete rows with a timestamp before cutoff in primary-key batches,
+    committing after each one so the write lock is never held for long.
+    Returns the number of rows deleted.
+    """
+    deleted = 0
+    while True:
+        batch = select(model.id).where(model.timestamp < cutoff).limit(DELETE_BATCH_SIZE)
+        count = db.execute(delete(model).where(model.id.in_(batch))).rowcount
+        db.commit()
+        deleted += count
+        if count < DELETE_BATCH_SIZE:
+            return deleted
+        # Give the collectors a chance to write between batches
+        time.sleep(DELETE_BATCH_PAUSE)
 
 # Database dependency
 def get_db():
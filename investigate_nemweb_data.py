@@ -23,7 +23,7 @@ def investigate_nemweb_directory(url, max_depth=2, current_depth=0):
         print(f"   Status: {response.status_code}")
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for links
             links = soup.find_all('a')
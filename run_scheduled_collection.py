@@ -9,7 +9,6 @@ import os
 from pathlib import Path
 import logging
 import signal
-import time
 
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent / "backend"
@@ -24,6 +23,7 @@ def main():
     """Main function to run scheduled data collection"""
     try:
         from backend.data.collectors.updated_data_collection_service import UpdatedDataCollectionService
+        from backend.data.collectors.scheduling import run_in_background, run_schedule_forever
         import schedule
         
         # Set up signal handler for graceful shutdown
@@ -51,9 +51,9 @@ def main():
         service = UpdatedDataCollectionService()
         
         # Schedule data collection
-        schedule.every(30).minutes.do(service.collect_and_store_electricity_data)
-        schedule.every(6).hours.do(service.collect_and_store_dam_data)
-        schedule.every().day.at("02:00").do(service.cleanup_old_data)
+        schedule.every(30).minutes.do(run_in_background, service.collect_and_store_electricity_data)
+        schedule.every(6).hours.do(run_in_background, service.collect_and_store_dam_data)
+        schedule.every().day.at("02:00").do(run_in_background, service.cleanup_old_data)
         
         # Run initial collection
         print("🚀 Running initial data collection...")
@@ -73,9 +73,7 @@ def main():
         print("   • Next cleanup: 2:00 AM daily")
         
         # Keep running and check for scheduled tasks
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        run_schedule_forever()
             
     except ImportError as e:
         print(f"❌ Error importing modules: {e}")
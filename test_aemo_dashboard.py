@@ -27,7 +27,7 @@ def test_aemo_dashboard():
             print("   ✅ Dashboard accessible")
             
             # Parse the HTML to understand the structure
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for data sources, APIs, or embedded data
             print(f"\n🔍 Analyzing dashboard structure...")
@@ -141,7 +141,7 @@ def test_nemweb_access():
                     print(f"   📁 Directory listing found")
                     
                     # Parse directory listing
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = BeautifulSoup(response.content, 'lxml')
                     links = soup.find_all('a')
                     print(f"   Found {len(links)} links in directory")
                     
@@ -34,7 +34,7 @@ class DataSourceTester:
             if response.status_code == 200:
                 logger.info("✅ AEMO website accessible")
                 # Check if there's any downloadable data
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 data_links = soup.find_all('a', href=True)
                 downloadable_data = [link for link in data_links if any(ext in link.get('href', '').lower() for ext in ['.csv', '.xlsx', '.json', 'api'])]
                 
@@ -84,7 +84,7 @@ class DataSourceTester:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Look for capacity data
                 capacity_elements = soup.find_all(text=lambda text: text and '%' in text and any(char.isdigit() for char in text))
@@ -95,7 +95,7 @@ class DataSourceTester:
                 hinze_response = self.session.get(hinze_url, timeout=10)
                 
                 if hinze_response.status_code == 200:
-                    hinze_soup = BeautifulSoup(hinze_response.content, 'html.parser')
+                    hinze_soup = BeautifulSoup(hinze_response.content, 'lxml')
                     hinze_capacity = hinze_soup.find_all(text=lambda text: text and '%' in text and any(char.isdigit() for char in text))
                     logger.info(f"✅ Hinze Dam page accessible, found {len(hinze_capacity)} capacity elements")
                     self.results['seqwater'] = {'status': 'accessible', 'main_page': True, 'specific_dams': True}
@@ -120,7 +120,7 @@ class DataSourceTester:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Look for API or data links
                 api_links = soup.find_all('a', href=True)
@@ -145,7 +145,7 @@ class DataSourceTester:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Look for storage level data
                 storage_elements = soup.find_all(text=lambda text: text and '%' in text and any(char.isdigit() for char in text))
@@ -168,7 +168,7 @@ class DataSourceTester:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Look for data tables or elements
                 data_elements = soup.find_all(['table', 'div'], class_=lambda x: x and any(keyword in x.lower() for keyword in ['data', 'level', 'storage']))
@@ -191,7 +191,7 @@ class DataSourceTester:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Look for lake level data
                 table = soup.find('table')